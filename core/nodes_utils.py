@@ -180,6 +180,30 @@ def map_objects(nested_list: Iterable, object_type: type, callback: 'function')
             return callback(nested_list)
 
 
+def memoize_by_identity(callback: 'function') -> 'function':
+    """Wraps a callback so that parameter tuples of identical objects are evaluated only once.
+
+    Broadcasting often repeats the very same input objects (i.e. one shape against several parameters or one shape
+    connected multiple times). The wrapper caches the callback result keyed on the ids of the tuple items. It is meant
+    to live for a single evaluation, while the input objects are alive and their ids can not be reused.
+
+    :param callback: Function that is called with a tuple of parameters, i.e. by map_objects
+    :type callback: 'function'
+    :return: Function with the same signature, returning cached results for repeated parameter tuples
+    :rtype: 'function'
+    """
+
+    memo: dict = {}
+
+    def wrapper(parameter_zip: tuple):
+        key: tuple = tuple(id(parameter) for parameter in parameter_zip)
+        if key not in memo:
+            memo[key] = callback(parameter_zip)
+        return memo[key]
+
+    return wrapper
+
+
 def map_last_level(nested_list: Iterable, object_type: type, callback: 'function') -> Iterable:
     """Applies a callback function to every penultimate level of a nested list.
 
@@ -252,6 +276,72 @@ def traverse_tuples(nested_list: Iterable) -> Iterable:
             yield nested_list
 
 
+class ShapeCache:
+    """Cache for values derived from shapes, i.e. bounding boxes or boolean results.
+
+    Entries are keyed by the hash codes of the shapes and verified with isSame, so shallow copies sharing the same
+    topology hit the cache while rebuilt shapes do not. Only the entries used during the current and the previous
+    evaluation are kept, next_evaluation has to be called at the start of each evaluation.
+
+     Attributes:
+        current (dict): Entries used during the current evaluation
+        previous (dict): Entries used during the previous evaluation
+    """
+    def __init__(self):
+        self.current: dict = {}
+        self.previous: dict = {}
+
+    def get(self, shape, compute: 'function'):
+        """Returns the cached value for the shape or computes it with compute(shape).
+
+        :param shape: Part.Shape the value is derived from
+        :type shape: Part.Shape
+        :param compute: Function that calculates the value from the shape
+        :type compute: 'function'
+        :return: Cached or computed value
+        """
+
+        return self.lookup((shape,), compute)
+
+    def get_pair(self, shape_a, shape_b, compute: 'function'):
+        """Returns the cached value for the pair of shapes or computes it with compute(shape_a, shape_b).
+
+        :param shape_a: First Part.Shape the value is derived from
+        :type shape_a: Part.Shape
+        :param shape_b: Second Part.Shape the value is derived from
+        :type shape_b: Part.Shape
+        :param compute: Function that calculates the value from both shapes
+        :type compute: 'function'
+        :return: Cached or computed value
+        """
+
+        return self.lookup((shape_a, shape_b), compute)
+
+    def lookup(self, shapes: tuple, compute: 'function'):
+        """Returns the cached value for the tuple of shapes or computes it with compute(*shapes)."""
+
+        key: tuple = tuple(shape.hashCode() for shape in shapes)
+        entry: tuple = self.current.get(key)
+        if entry is None:
+            entry = self.previous.get(key)
+        if entry is None or not all(cached.isSame(shape) for cached, shape in zip(entry[0], shapes)):
+            entry = (shapes, compute(*shapes))
+        self.current[key] = entry
+        return entry[1]
+
+    def next_evaluation(self) -> None:
+        """Drops all entries not used during the last evaluation."""
+
+        self.previous = self.current
+        self.current = {}
+
+    def clear(self) -> None:
+        """Drops all entries."""
+
+        self.current = {}
+        self.previous = {}
+
+
 class ListWrapper:
     """Wrapper for lists.
 
@@ -11,16 +11,105 @@
 #  2. Restart FreeCAD
 #
 ###################################################################################
-from FreeCAD import Vector
+import math
+import traceback
+
+import numpy as np
+
+from FreeCAD import Vector, Matrix, Placement, Rotation
 import Part
 
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel
-from core.nodes_utils import map_objects, broadcast_data_tree
+from core.nodes_utils import map_objects, broadcast_data_tree, memoize_by_identity, traverse_tuples
 
 from nodes_locator import icon
 
 
+# Unit vectors for the axis/direction sockets: 0=X, 1=Y, 2=Z
+# Shared between calls, never modify them in place (e.g. with multiply())
+AXES: tuple = (Vector(1, 0, 0), Vector(0, 1, 0), Vector(0, 0, 1))
+ORIGIN: Vector = Vector(0, 0, 0)
+
+
+def axis_vector(axis: int) -> Vector:
+    """Unit vector for an axis index, any other value than 0 or 1 means Z."""
+    return AXES[axis] if axis in (0, 1) else AXES[2]
+
+
+def tree_fuse(shapes_list: list) -> Part.Shape:
+    """
+    Fuse shapes as a balanced pairwise reduction (pairs, then pairs of pairs).
+    
+    Every fuse works on operands of similar size instead of growing one
+    ever-larger result, so n copies cost O(n log n) instead of O(n^2).
+    """
+    shapes = list(shapes_list)
+    while len(shapes) > 1:
+        fused = [a.fuse(b) for a, b in zip(shapes[0::2], shapes[1::2])]
+        if len(shapes) % 2:
+            fused.append(shapes[-1])
+        shapes = fused
+    return shapes[0]
+
+
+def translation_matrix(offset: Vector) -> Matrix:
+    """Pure translation matrix, applied with Shape.transformed()."""
+    matrix = Matrix()
+    matrix.move(offset)
+    return matrix
+
+
+def accumulated_offsets(step_vec: Vector, n: int) -> list:
+    """[step, 2*step, ..., n*step] as a running sum, one addition per offset."""
+    offsets = []
+    offset = ORIGIN
+    for _ in range(n):
+        offset = offset + step_vec
+        offsets.append(offset)
+    return offsets
+
+
+def rotation_matrix(axis_vec: Vector, angle: float) -> Matrix:
+    """Rotation matrix around an axis through the origin, angle in degrees."""
+    if axis_vec is AXES[2]:
+        # Z axis (most common): plain rotation in the XY plane, no quaternion
+        matrix = Matrix()
+        matrix.rotateZ(math.radians(angle))
+        return matrix
+    return Placement(ORIGIN, Rotation(axis_vec, angle)).toMatrix()
+
+
+def matrix_powers(step: Matrix, n: int) -> list:
+    """
+    [step, step^2, ..., step^n] by repeated multiplication.
+    
+    Used for rotations, where it replaces n sin/cos evaluations by one plus
+    n cheap matrix products.
+    """
+    matrices = []
+    matrix = step
+    for _ in range(n):
+        matrices.append(matrix)
+        matrix = step * matrix
+    return matrices
+
+
+def transformed_copies(shape: Part.Shape, matrices: list) -> list:
+    """
+    Copy of shape followed by one transformed copy per matrix.
+    
+    The first copy is a new Part.Shape sharing the original topology: no
+    node modifies it in place, so the deep copy of shape.copy() is not
+    needed.
+    
+    The copies are independent, but Part keeps the GIL while OCCT works, so
+    a thread pool would only serialize them; map() drives them without a
+    Python-level loop body instead.
+    """
+    return [Part.Shape(shape)] + list(map(shape.transformed, matrices))
+
+
 @register_node
 class LinearArray(FCNNodeModel):
     """
@@ -33,7 +122,7 @@ class LinearArray(FCNNodeModel):
         Direction: 0=X, 1=Y, 2=Z (default Z)
     
     Output:
-        Shape: All copies combined (fused)
+        Shape: All copies combined (compound, fused if fuse_output is set)
         Shapes: List of individual shapes
     
     Example:
@@ -45,6 +134,7 @@ class LinearArray(FCNNodeModel):
     op_title: str = "Linear Array"
     op_category: str = "Modifiers"
     content_label_objname: str = "fcn_node_bg"
+    fuse_output: bool = False
     
     def __init__(self, scene):
         super().__init__(scene=scene,
@@ -55,8 +145,8 @@ class LinearArray(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
     
-    @staticmethod
-    def make_array(parameter_zip: tuple) -> tuple:
+    @classmethod
+    def make_array(cls, parameter_zip: tuple) -> tuple:
         shape: Part.Shape = parameter_zip[0]
         count: int = int(parameter_zip[1]) if len(parameter_zip) > 1 else 3
         spacing: float = float(parameter_zip[2]) if len(parameter_zip) > 2 else 100.0
@@ -65,38 +155,24 @@ class LinearArray(FCNNodeModel):
         # Ensure at least 1 copy
         count = max(1, count)
         
+        # Single copy: nothing to transform or combine
+        if count == 1:
+            copy = Part.Shape(shape)
+            return (copy, [copy])
+        
         # Create direction vector
-        if direction == 0:
-            dir_vec = Vector(1, 0, 0)  # X
-        elif direction == 1:
-            dir_vec = Vector(0, 1, 0)  # Y
-        else:
-            dir_vec = Vector(0, 0, 1)  # Z (default)
+        dir_vec = axis_vector(direction)
+        
+        # Offset between two neighbouring copies
+        step_vec = Vector(dir_vec.x * spacing, dir_vec.y * spacing, dir_vec.z * spacing)
         
         try:
-            shapes_list = []
-            
-            for i in range(count):
-                # Calculate offset
-                offset = Vector(dir_vec.x * spacing * i,
-                               dir_vec.y * spacing * i,
-                               dir_vec.z * spacing * i)
-                
-                # Create translated copy
-                if i == 0:
-                    copy = shape.copy()
-                else:
-                    copy = shape.translated(offset)
-                
-                shapes_list.append(copy)
+            # Translated copies after the original
+            matrices = [translation_matrix(offset) for offset in accumulated_offsets(step_vec, count - 1)]
+            shapes_list = transformed_copies(shape, matrices)
             
-            # Fuse all shapes into one
-            if len(shapes_list) > 1:
-                combined = shapes_list[0]
-                for s in shapes_list[1:]:
-                    combined = combined.fuse(s)
-            else:
-                combined = shapes_list[0]
+            # Compound by default, fuse only on request
+            combined = tree_fuse(shapes_list) if cls.fuse_output else Part.makeCompound(shapes_list)
             
             return (combined, shapes_list)
             
@@ -114,14 +190,13 @@ class LinearArray(FCNNodeModel):
         if len(shape_input) == 0:
             return [[], []]
         
-        # Process each shape
-        combined_list = []
-        shapes_list = []
+        # Broadcast and calculate result, repeated parameter tuples only once
+        data_tree: list = list(broadcast_data_tree(shape_input, count_input, spacing_input, direction_input))
+        result: list = list(map_objects(data_tree, tuple, memoize_by_identity(self.make_array)))
         
-        for shape in shape_input:
-            result = self.make_array((shape, count_input[0], spacing_input[0], direction_input[0]))
-            combined_list.append(result[0])
-            shapes_list.extend(result[1])
+        # Distribute result to socket outputs
+        combined_list: list = list(map_objects(result, tuple, lambda array_tuple: array_tuple[0]))
+        shapes_list: list = [shape for array_tuple in traverse_tuples(result) for shape in array_tuple[1]]
         
         return [combined_list, shapes_list]
 
@@ -137,7 +212,7 @@ class LinearArrayVector(FCNNodeModel):
         Vector: Direction and spacing as vector (e.g., 100,0,50 = X+Z diagonal)
     
     Output:
-        Shape: All copies combined
+        Shape: All copies combined (compound, fused if fuse_output is set)
         Shapes: List of individual shapes
     
     Example:
@@ -149,6 +224,7 @@ class LinearArrayVector(FCNNodeModel):
     op_title: str = "Array Vector"
     op_category: str = "Modifiers"
     content_label_objname: str = "fcn_node_bg"
+    fuse_output: bool = False
     
     def __init__(self, scene):
         super().__init__(scene=scene,
@@ -159,8 +235,8 @@ class LinearArrayVector(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
     
-    @staticmethod
-    def make_array_vector(parameter_zip: tuple) -> tuple:
+    @classmethod
+    def make_array_vector(cls, parameter_zip: tuple) -> tuple:
         shape: Part.Shape = parameter_zip[0]
         count: int = int(parameter_zip[1]) if len(parameter_zip) > 1 else 3
         vec = parameter_zip[2] if len(parameter_zip) > 2 else Vector(0, 0, 100)
@@ -175,26 +251,17 @@ class LinearArrayVector(FCNNodeModel):
         
         count = max(1, count)
         
+        # Single copy: nothing to transform or combine
+        if count == 1:
+            copy = Part.Shape(shape)
+            return (copy, [copy])
+        
         try:
-            shapes_list = []
+            matrices = [translation_matrix(offset) for offset in accumulated_offsets(direction, count - 1)]
+            shapes_list = transformed_copies(shape, matrices)
             
-            for i in range(count):
-                offset = Vector(direction.x * i, direction.y * i, direction.z * i)
-                
-                if i == 0:
-                    copy = shape.copy()
-                else:
-                    copy = shape.translated(offset)
-                
-                shapes_list.append(copy)
-            
-            # Fuse all shapes
-            if len(shapes_list) > 1:
-                combined = shapes_list[0]
-                for s in shapes_list[1:]:
-                    combined = combined.fuse(s)
-            else:
-                combined = shapes_list[0]
+            # Compound by default, fuse only on request
+            combined = tree_fuse(shapes_list) if cls.fuse_output else Part.makeCompound(shapes_list)
             
             return (combined, shapes_list)
             
@@ -210,13 +277,13 @@ class LinearArrayVector(FCNNodeModel):
         if len(shape_input) == 0:
             return [[], []]
         
-        combined_list = []
-        shapes_list = []
+        # Broadcast and calculate result, repeated parameter tuples only once
+        data_tree: list = list(broadcast_data_tree(shape_input, count_input, vector_input))
+        result: list = list(map_objects(data_tree, tuple, memoize_by_identity(self.make_array_vector)))
         
-        for shape in shape_input:
-            result = self.make_array_vector((shape, count_input[0], vector_input[0]))
-            combined_list.append(result[0])
-            shapes_list.extend(result[1])
+        # Distribute result to socket outputs
+        combined_list: list = list(map_objects(result, tuple, lambda array_tuple: array_tuple[0]))
+        shapes_list: list = [shape for array_tuple in traverse_tuples(result) for shape in array_tuple[1]]
         
         return [combined_list, shapes_list]
 
@@ -234,7 +301,7 @@ class RectangularArray(FCNNodeModel):
         Spacing Y: Distance in Y
     
     Output:
-        Shape: All copies combined
+        Shape: All copies combined (compound, fused if fuse_output is set)
         Shapes: List of individual shapes
     
     Example:
@@ -246,6 +313,7 @@ class RectangularArray(FCNNodeModel):
     op_title: str = "Rect Array"
     op_category: str = "Modifiers"
     content_label_objname: str = "fcn_node_bg"
+    fuse_output: bool = False
     
     def __init__(self, scene):
         super().__init__(scene=scene,
@@ -257,8 +325,8 @@ class RectangularArray(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
     
-    @staticmethod
-    def make_rect_array(parameter_zip: tuple) -> tuple:
+    @classmethod
+    def make_rect_array(cls, parameter_zip: tuple) -> tuple:
         shape: Part.Shape = parameter_zip[0]
         count_x: int = int(parameter_zip[1]) if len(parameter_zip) > 1 else 3
         count_y: int = int(parameter_zip[2]) if len(parameter_zip) > 2 else 3
@@ -268,27 +336,22 @@ class RectangularArray(FCNNodeModel):
         count_x = max(1, count_x)
         count_y = max(1, count_y)
         
+        # Single copy: nothing to transform or combine
+        if count_x == 1 and count_y == 1:
+            copy = Part.Shape(shape)
+            return (copy, [copy])
+        
+        # All grid offsets at once, row by row (x major, y minor)
+        ii, jj = np.meshgrid(np.arange(count_x), np.arange(count_y), indexing='ij')
+        offsets = np.stack([ii * spacing_x, jj * spacing_y, np.zeros(ii.shape)], -1).reshape(-1, 3)
+        
         try:
-            shapes_list = []
+            # First offset is the origin, i.e. the original shape
+            matrices = [translation_matrix(Vector(ox, oy, oz)) for ox, oy, oz in offsets[1:].tolist()]
+            shapes_list = transformed_copies(shape, matrices)
             
-            for i in range(count_x):
-                for j in range(count_y):
-                    offset = Vector(spacing_x * i, spacing_y * j, 0)
-                    
-                    if i == 0 and j == 0:
-                        copy = shape.copy()
-                    else:
-                        copy = shape.translated(offset)
-                    
-                    shapes_list.append(copy)
-            
-            # Fuse all shapes
-            if len(shapes_list) > 1:
-                combined = shapes_list[0]
-                for s in shapes_list[1:]:
-                    combined = combined.fuse(s)
-            else:
-                combined = shapes_list[0]
+            # Compound by default, fuse only on request
+            combined = tree_fuse(shapes_list) if cls.fuse_output else Part.makeCompound(shapes_list)
             
             return (combined, shapes_list)
             
@@ -306,14 +369,14 @@ class RectangularArray(FCNNodeModel):
         if len(shape_input) == 0:
             return [[], []]
         
-        combined_list = []
-        shapes_list = []
+        # Broadcast and calculate result, repeated parameter tuples only once
+        data_tree: list = list(broadcast_data_tree(shape_input, count_x_input, count_y_input,
+                                                   spacing_x_input, spacing_y_input))
+        result: list = list(map_objects(data_tree, tuple, memoize_by_identity(self.make_rect_array)))
         
-        for shape in shape_input:
-            result = self.make_rect_array((shape, count_x_input[0], count_y_input[0],
-                                           spacing_x_input[0], spacing_y_input[0]))
-            combined_list.append(result[0])
-            shapes_list.extend(result[1])
+        # Distribute result to socket outputs
+        combined_list: list = list(map_objects(result, tuple, lambda array_tuple: array_tuple[0]))
+        shapes_list: list = [shape for array_tuple in traverse_tuples(result) for shape in array_tuple[1]]
         
         return [combined_list, shapes_list]
 
@@ -330,7 +393,7 @@ class PolarArray(FCNNodeModel):
         Axis: 0=X, 1=Y, 2=Z (rotation axis, default Z)
     
     Output:
-        Shape: All copies combined
+        Shape: All copies combined (compound, fused if fuse_output is set)
         Shapes: List of individual shapes
     
     Example:
@@ -342,6 +405,7 @@ class PolarArray(FCNNodeModel):
     op_title: str = "Polar Array"
     op_category: str = "Modifiers"
     content_label_objname: str = "fcn_node_bg"
+    fuse_output: bool = False
     
     def __init__(self, scene):
         super().__init__(scene=scene,
@@ -352,10 +416,8 @@ class PolarArray(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
     
-    @staticmethod
-    def make_polar_array(parameter_zip: tuple) -> tuple:
-        import math
-        
+    @classmethod
+    def make_polar_array(cls, parameter_zip: tuple) -> tuple:
         shape: Part.Shape = parameter_zip[0]
         count: int = int(parameter_zip[1]) if len(parameter_zip) > 1 else 6
         total_angle: float = float(parameter_zip[2]) if len(parameter_zip) > 2 else 360.0
@@ -363,13 +425,13 @@ class PolarArray(FCNNodeModel):
         
         count = max(1, count)
         
+        # Single copy: nothing to transform or combine
+        if count == 1:
+            copy = Part.Shape(shape)
+            return (copy, [copy])
+        
         # Create axis vector
-        if axis == 0:
-            axis_vec = Vector(1, 0, 0)  # X
-        elif axis == 1:
-            axis_vec = Vector(0, 1, 0)  # Y
-        else:
-            axis_vec = Vector(0, 0, 1)  # Z (default)
+        axis_vec = axis_vector(axis)
         
         # Angle per copy
         if count > 1:
@@ -378,27 +440,13 @@ class PolarArray(FCNNodeModel):
             angle_step = 0
         
         try:
-            shapes_list = []
-            
-            for i in range(count):
-                angle = angle_step * i
-                
-                if i == 0:
-                    copy = shape.copy()
-                else:
-                    # Rotate around axis through origin
-                    copy = shape.copy()
-                    copy.rotate(Vector(0, 0, 0), axis_vec, angle)
-                
-                shapes_list.append(copy)
+            # Rotate around axis through origin, without cloning first;
+            # the i-th rotation is the i-th power of one step rotation
+            matrices = matrix_powers(rotation_matrix(axis_vec, angle_step), count - 1)
+            shapes_list = transformed_copies(shape, matrices)
             
-            # Fuse all shapes
-            if len(shapes_list) > 1:
-                combined = shapes_list[0]
-                for s in shapes_list[1:]:
-                    combined = combined.fuse(s)
-            else:
-                combined = shapes_list[0]
+            # Compound by default, fuse only on request
+            combined = tree_fuse(shapes_list) if cls.fuse_output else Part.makeCompound(shapes_list)
             
             return (combined, shapes_list)
             
@@ -415,13 +463,13 @@ class PolarArray(FCNNodeModel):
         if len(shape_input) == 0:
             return [[], []]
         
-        combined_list = []
-        shapes_list = []
+        # Broadcast and calculate result, repeated parameter tuples only once
+        data_tree: list = list(broadcast_data_tree(shape_input, count_input, angle_input, axis_input))
+        result: list = list(map_objects(data_tree, tuple, memoize_by_identity(self.make_polar_array)))
         
-        for shape in shape_input:
-            result = self.make_polar_array((shape, count_input[0], angle_input[0], axis_input[0]))
-            combined_list.append(result[0])
-            shapes_list.extend(result[1])
+        # Distribute result to socket outputs
+        combined_list: list = list(map_objects(result, tuple, lambda array_tuple: array_tuple[0]))
+        shapes_list: list = [shape for array_tuple in traverse_tuples(result) for shape in array_tuple[1]]
         
         return [combined_list, shapes_list]
         
@@ -465,61 +513,42 @@ class PolarArrayUp(FCNNodeModel):
     
     @staticmethod
     def make_polar_array_up(parameter_zip: tuple) -> tuple:
-        import math
-        
         shape: Part.Shape = parameter_zip[0]
         count: int = int(parameter_zip[1]) if len(parameter_zip) > 1 else 6
         total_angle: float = float(parameter_zip[2]) if len(parameter_zip) > 2 else 360.0
         axis: int = int(parameter_zip[3]) if len(parameter_zip) > 3 else 2  # Default Z
         step: float = float(parameter_zip[4]) if len(parameter_zip) > 4 else 25.0
         
+        # Handle FreeCAD objects
+        if hasattr(shape, 'Shape'):
+            shape = shape.Shape
+        
         count = max(1, count)
         
         # Axis vector (used for both rotation and translation)
-        if axis == 0:
-            axis_vec = Vector(1, 0, 0)  # X
-        elif axis == 1:
-            axis_vec = Vector(0, 1, 0)  # Y
-        else:
-            axis_vec = Vector(0, 0, 1)  # Z
+        axis_vec = axis_vector(axis)
         
         # Angle per copy
         angle_step = total_angle / count if count > 1 else 0
         
+        # One helix step: rotation around the axis through the origin followed
+        # by the translation along it. Both commute, so the i-th copy is placed
+        # by step^i and each copy costs one matrix product and one transform
+        step_matrix = translation_matrix(Vector(axis_vec.x * step,
+                                                axis_vec.y * step,
+                                                axis_vec.z * step)) * rotation_matrix(axis_vec, angle_step)
+        
         try:
-            shapes_list = []
-            
-            for i in range(count):
-                angle = angle_step * i
-                copy = shape.copy()
-                
-                # Rotate around axis (only if not first copy and angle > 0)
-                if angle != 0:
-                    copy.rotate(Vector(0, 0, 0), axis_vec, angle)
-                
-                # Translate along same axis
-                # FIX: Don't use multiply() - it modifies in place!
-                # Use Vector multiplication instead
-                translation = Vector(
-                    axis_vec.x * step * i,
-                    axis_vec.y * step * i,
-                    axis_vec.z * step * i
-                )
-                copy.translate(translation)
-                
-                shapes_list.append(copy)
+            matrices = matrix_powers(step_matrix, count - 1)
+            shapes_list = transformed_copies(shape, matrices)
             
             # Make compound instead of fuse (faster and preserves individual shapes)
-            if len(shapes_list) > 0:
-                combined = Part.makeCompound(shapes_list)
-            else:
-                combined = shape
+            combined = Part.makeCompound(shapes_list)
             
             return (combined, shapes_list)
         
         except Exception as e:
             print(f"PolarArrayUp error: {e}")
-            import traceback
             traceback.print_exc()
             return (shape, [shape])
     
@@ -533,16 +562,12 @@ class PolarArrayUp(FCNNodeModel):
         if len(shape_input) == 0:
             return [[], []]
         
-        combined_list = []
-        shapes_list = []
+        # Broadcast and calculate result, repeated parameter tuples only once
+        data_tree: list = list(broadcast_data_tree(shape_input, count_input, angle_input, axis_input, step_input))
+        result: list = list(map_objects(data_tree, tuple, memoize_by_identity(self.make_polar_array_up)))
         
-        for shape in shape_input:
-            # Handle FreeCAD objects
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            result = self.make_polar_array_up((shape, count_input[0], angle_input[0], axis_input[0], step_input[0]))
-            combined_list.append(result[0])
-            shapes_list.extend(result[1])
+        # Distribute result to socket outputs
+        combined_list: list = list(map_objects(result, tuple, lambda array_tuple: array_tuple[0]))
+        shapes_list: list = [shape for array_tuple in traverse_tuples(result) for shape in array_tuple[1]]
         
         return [combined_list, shapes_list]
@@ -18,7 +18,7 @@ from qtpy.QtWidgets import QLineEdit, QLayout, QVBoxLayout, QHBoxLayout, QLabel
 from qtpy.QtCore import Qt
 
 import FreeCAD as App
-from FreeCAD import Vector
+from FreeCAD import Vector, Rotation
 import Part
 
 from nodeeditor.node_content_widget import QDMNodeContentWidget
@@ -27,48 +27,134 @@ from nodeeditor.node_graphics_node import QDMGraphicsNode
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel, FCNNodeContentView
 from core.nodes_default_node import FCNNodeView
-from core.nodes_utils import map_objects, broadcast_data_tree, flatten
+from core.nodes_utils import map_objects, broadcast_data_tree, flatten, ShapeCache
 
 from nodes_locator import icon
 
 
+DEBUG = False
+
+
+# Axis vectors shared by all evaluations, never modify them in place
+AXIS_X = Vector(1, 0, 0)
+AXIS_Y = Vector(0, 1, 0)
+AXIS_Z = Vector(0, 0, 1)
+
+AXIS_TABLE = {
+    "X": (AXIS_X, "X"), "Y": (AXIS_Y, "Y"), "Z": (AXIS_Z, "Z"),
+    0: (AXIS_X, "X"), 1: (AXIS_Y, "Y"),
+}
+
+# Cutting plane geometry per axis: (normal, tilt axis, bounding box limits along the normal)
+AXIS_PLANES = {
+    "X": (AXIS_X, AXIS_Z, "XMin", "XMax"),
+    "Y": (AXIS_Y, AXIS_Z, "YMin", "YMax"),
+    "Z": (AXIS_Z, AXIS_X, "ZMin", "ZMax"),
+}
+
+
 def parse_axis(axis_input) -> tuple:
     """
     Parse axis input - accepts text or number.
     
+    "X", "Y", "Z" or 0, 1, anything else falls back to Z.
+    
     Returns:
         (axis_vector, axis_name)
     """
     if isinstance(axis_input, str):
-        a = axis_input.strip().upper()
-        if a == "X":
-            return (Vector(1, 0, 0), "X")
-        elif a == "Y":
-            return (Vector(0, 1, 0), "Y")
-        elif a == "Z":
-            return (Vector(0, 0, 1), "Z")
-        else:
-            try:
-                num = int(float(axis_input))
-                if num == 0:
-                    return (Vector(1, 0, 0), "X")
-                elif num == 1:
-                    return (Vector(0, 1, 0), "Y")
-                else:
-                    return (Vector(0, 0, 1), "Z")
-            except:
-                return (Vector(0, 0, 1), "Z")
-    else:
-        try:
-            num = int(axis_input)
-            if num == 0:
-                return (Vector(1, 0, 0), "X")
-            elif num == 1:
-                return (Vector(0, 1, 0), "Y")
+        axis = AXIS_TABLE.get(axis_input.strip().upper())
+        if axis is not None:
+            return axis
+    try:
+        num = int(float(axis_input)) if isinstance(axis_input, str) else int(axis_input)
+    except (TypeError, ValueError, OverflowError):
+        return AXIS_TABLE["Z"]
+    return AXIS_TABLE.get(num, AXIS_TABLE["Z"])
+
+
+def bound_box(shape):
+    return shape.BoundBox
+
+
+def cut_size(bbox) -> float:
+    """Half extent of the cutting plane face, large enough to cover the shape with this bounding box"""
+    return max(bbox.XLength, bbox.YLength, bbox.ZLength) * 10 + 1000
+
+
+def make_cut_face(base_point: Vector, normal: Vector, size: float) -> Part.Face:
+    """Square face of 2*size in the cutting plane, centered at base_point"""
+    return Part.Plane(base_point, normal).toShape(-size, size, -size, size)
+
+
+def cutting_plane(axis_name: str, position: float, angle: float) -> tuple:
+    """
+    Cutting plane at position along the axis, rotated by angle (degrees).
+    
+    Returns:
+        (base_point, normal)
+    """
+    normal, rot_axis, _, _ = AXIS_PLANES[axis_name]
+    base_point = normal * position
+    
+    # Apply angle rotation if needed
+    if angle != 0:
+        normal = Rotation(rot_axis, angle).multVec(normal)
+    
+    return (base_point, normal)
+
+
+def plane_side(bbox, axis_name: str, position: float, angle: float) -> int:
+    """
+    Side of the cutting plane the whole bounding box lies on.
+    
+    Only decided for axis aligned planes (angle 0), where the cut can be
+    skipped if the plane does not pass through the bounding box.
+    
+    Returns:
+        -1 below the plane, 1 above the plane, 0 if the plane has to cut
+    """
+    if angle != 0:
+        return 0
+    _, _, low, high = AXIS_PLANES[axis_name]
+    if position >= getattr(bbox, high):
+        return -1
+    if position <= getattr(bbox, low):
+        return 1
+    return 0
+
+
+def make_half_space(face: Part.Face, base_point: Vector, normal: Vector, positive: bool) -> Part.Shape:
+    """
+    Half-space solid bounded by the cutting face through base_point.
+    
+    The matter lies on the side the normal points to (positive=True) or on
+    the opposite side. The face has to cover the shape that is cut.
+    """
+    ref_point = base_point + normal if positive else base_point - normal
+    return face.makeHalfSpace(ref_point)
+
+
+def split_by_plane(shape, face: Part.Face, base_point: Vector, normal: Vector) -> tuple:
+    """
+    Split shape at the cutting face with a single generalFuse.
+    
+    The pieces of shape are sorted by the side of the plane their center
+    of mass lies on.
+    
+    Returns:
+        (negative_half, positive_half) as compounds
+    """
+    pieces, mapping = shape.generalFuse([face])
+    negative_pieces = []
+    positive_pieces = []
+    for piece in mapping[0]:
+        for sub_piece in (piece.childShapes() if piece.ShapeType == "Compound" else [piece]):
+            if (sub_piece.CenterOfMass - base_point).dot(normal) > 0:
+                positive_pieces.append(sub_piece)
             else:
-                return (Vector(0, 0, 1), "Z")
-        except:
-            return (Vector(0, 0, 1), "Z")
+                negative_pieces.append(sub_piece)
+    return (Part.makeCompound(negative_pieces), Part.makeCompound(positive_pieces))
 
 
 class BisectContent(QDMNodeContentWidget):
@@ -76,6 +162,7 @@ class BisectContent(QDMNodeContentWidget):
     
     layout: QLayout
     axis_edit: QLineEdit
+    axis: tuple
 
     def initUI(self):
         self.layout: QLayout = QVBoxLayout()
@@ -88,6 +175,13 @@ class BisectContent(QDMNodeContentWidget):
         self.axis_edit.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.axis_edit)
 
+        # Parsed (axis_vector, axis_name), updated before the node reevaluates
+        self.axis: tuple = parse_axis(self.axis_edit.text())
+        self.axis_edit.textChanged.connect(self.update_axis)
+
+    def update_axis(self, text: str):
+        self.axis = parse_axis(str(text))
+
     def serialize(self) -> OrderedDict:
         res: OrderedDict = super().serialize()
         res['axis'] = self.axis_edit.text()
@@ -134,6 +228,9 @@ class Bisect(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        # Bounding boxes of the input shapes, reused across evaluations
+        self.bbox_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Shape", True), ("Pos", True), ("Angle", True)],
                          outputs_init_list=[("Shape", True)])
@@ -147,67 +244,61 @@ class Bisect(FCNNodeModel):
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
         self.content.axis_edit.textChanged.connect(self.onInputChanged)
 
+    def onInputChanged(self, socket):
+        self.bbox_cache.clear()
+        super().onInputChanged(socket)
+
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.bbox_cache.next_evaluation()
+
         # Get inputs
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        position = float(sockets_input_data[1][0]) if len(sockets_input_data[1]) > 0 else 0.0
-        angle = float(sockets_input_data[2][0]) if len(sockets_input_data[2]) > 0 else 0.0
+        shape_input = flatten(sockets_input_data[0])
+        if not shape_input:
+            if DEBUG:
+                print("Bisect: No input shape")
+            return [[]]
         
-        # Get axis from text box
-        axis_text = str(self.content.axis_edit.text())
-        axis_vec, axis_name = parse_axis(axis_text)
+        position = float(sockets_input_data[1][0]) if sockets_input_data[1] else 0.0
+        angle = float(sockets_input_data[2][0]) if sockets_input_data[2] else 0.0
         
-        if len(shape_input) == 0:
-            print("Bisect: No input shape")
-            return [[]]
+        # Get axis from text box
+        axis_vec, axis_name = self.content.axis
         
         results = []
         
-        for shape in shape_input:
-            cut_result = self.make_bisect(shape, axis_vec, axis_name, position, angle)
+        # One half-space for all shapes, sized to cover the largest one
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        bound_boxes = [self.bbox_cache.get(shape, bound_box) for shape in shapes]
+        sides = [plane_side(bbox, axis_name, position, angle) for bbox in bound_boxes]
+        size = max(cut_size(bbox) for bbox in bound_boxes)
+        base_point, normal = cutting_plane(axis_name, position, angle)
+        if 0 in sides:
+            half_space = make_half_space(make_cut_face(base_point, normal, size), base_point, normal, True)
+        else:
+            half_space = None
+        
+        for shape, side in zip(shapes, sides):
+            cut_result = self.make_bisect(shape, half_space, side, axis_name, position, angle)
             if cut_result is not None:
                 results.append(cut_result)
         
-        return [results] if results else [[]]
+        return [results]
     
-    def make_bisect(self, shape, axis_vec, axis_name, position, angle):
+    def make_bisect(self, shape, half_space, side, axis_name, position, angle):
         """Create bisect cut"""
         try:
-            # Handle different input types
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            # Get bounding box of shape
-            bbox = shape.BoundBox
-            size = max(bbox.XLength, bbox.YLength, bbox.ZLength) * 10 + 1000
-            
-            # Create cutting box on POSITIVE side (to be removed)
-            if axis_name == "Z":
-                base_point = Vector(0, 0, position)
-                cut_box = Part.makeBox(size * 2, size * 2, size)
-                cut_box.translate(Vector(-size, -size, position))
-                rot_axis = Vector(1, 0, 0)
-                    
-            elif axis_name == "X":
-                base_point = Vector(position, 0, 0)
-                cut_box = Part.makeBox(size, size * 2, size * 2)
-                cut_box.translate(Vector(position, -size, -size))
-                rot_axis = Vector(0, 0, 1)
-                    
-            else:  # Y
-                base_point = Vector(0, position, 0)
-                cut_box = Part.makeBox(size * 2, size, size * 2)
-                cut_box.translate(Vector(-size, position, -size))
-                rot_axis = Vector(0, 0, 1)
-            
-            # Apply angle rotation if needed
-            if angle != 0:
-                cut_box.rotate(base_point, rot_axis, angle)
-            
-            # Cut: remove the positive side
-            result = shape.cut(cut_box)
+            if side < 0:
+                # Shape below the plane, nothing to remove
+                result = Part.Shape(shape)
+            elif side > 0:
+                # Shape above the plane, everything removed
+                result = Part.makeCompound([])
+            else:
+                # Cut: remove the positive side
+                result = shape.cut(half_space)
             
-            print(f"Bisect: Cut at {axis_name}={position}, angle={angle}°")
+            if DEBUG:
+                print(f"Bisect: Cut at {axis_name}={position}, angle={angle}°")
             return result
             
         except Exception as e:
@@ -239,6 +330,9 @@ class BisectKeep(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        # Bounding boxes of the input shapes, reused across evaluations
+        self.bbox_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Shape", True), ("Pos", True), 
                                           ("Angle", True), ("Keep", True)],
@@ -253,12 +347,23 @@ class BisectKeep(FCNNodeModel):
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
         self.content.axis_edit.textChanged.connect(self.onInputChanged)
 
+    def onInputChanged(self, socket):
+        self.bbox_cache.clear()
+        super().onInputChanged(socket)
+
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.bbox_cache.next_evaluation()
+
         # Get inputs
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        position = float(sockets_input_data[1][0]) if len(sockets_input_data[1]) > 0 else 0.0
-        angle = float(sockets_input_data[2][0]) if len(sockets_input_data[2]) > 0 else 0.0
-        keep = sockets_input_data[3][0] if len(sockets_input_data[3]) > 0 else 0
+        shape_input = flatten(sockets_input_data[0])
+        if not shape_input:
+            if DEBUG:
+                print("BisectKeep: No input shape")
+            return [[]]
+        
+        position = float(sockets_input_data[1][0]) if sockets_input_data[1] else 0.0
+        angle = float(sockets_input_data[2][0]) if sockets_input_data[2] else 0.0
+        keep = sockets_input_data[3][0] if sockets_input_data[3] else 0
         
         # Parse keep value
         if isinstance(keep, str):
@@ -267,72 +372,42 @@ class BisectKeep(FCNNodeModel):
             keep_positive = bool(keep)
         
         # Get axis from text box
-        axis_text = str(self.content.axis_edit.text())
-        axis_vec, axis_name = parse_axis(axis_text)
-        
-        if len(shape_input) == 0:
-            print("BisectKeep: No input shape")
-            return [[]]
+        axis_vec, axis_name = self.content.axis
         
         results = []
         
-        for shape in shape_input:
-            cut_result = self.make_bisect(shape, axis_name, position, angle, keep_positive)
+        # One half-space for all shapes, sized to cover the largest one
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        bound_boxes = [self.bbox_cache.get(shape, bound_box) for shape in shapes]
+        sides = [plane_side(bbox, axis_name, position, angle) for bbox in bound_boxes]
+        size = max(cut_size(bbox) for bbox in bound_boxes)
+        base_point, normal = cutting_plane(axis_name, position, angle)
+        if 0 in sides:
+            half_space = make_half_space(make_cut_face(base_point, normal, size), base_point, normal,
+                                         not keep_positive)
+        else:
+            half_space = None
+        
+        for shape, side in zip(shapes, sides):
+            cut_result = self.make_bisect(shape, half_space, side, axis_name, position, keep_positive)
             if cut_result is not None:
                 results.append(cut_result)
         
-        return [results] if results else [[]]
+        return [results]
     
-    def make_bisect(self, shape, axis_name, position, angle, keep_positive):
+    def make_bisect(self, shape, half_space, side, axis_name, position, keep_positive):
         """Create bisect cut with choice of which side to keep"""
         try:
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            # Get bounding box
-            bbox = shape.BoundBox
-            size = max(bbox.XLength, bbox.YLength, bbox.ZLength) * 10 + 1000
-            
-            # Create cutting box
-            if axis_name == "Z":
-                if keep_positive:
-                    cut_box = Part.makeBox(size * 2, size * 2, size)
-                    cut_box.translate(Vector(-size, -size, position - size))
-                else:
-                    cut_box = Part.makeBox(size * 2, size * 2, size)
-                    cut_box.translate(Vector(-size, -size, position))
-                base_point = Vector(0, 0, position)
-                rot_axis = Vector(1, 0, 0)
-                    
-            elif axis_name == "X":
-                if keep_positive:
-                    cut_box = Part.makeBox(size, size * 2, size * 2)
-                    cut_box.translate(Vector(position - size, -size, -size))
-                else:
-                    cut_box = Part.makeBox(size, size * 2, size * 2)
-                    cut_box.translate(Vector(position, -size, -size))
-                base_point = Vector(position, 0, 0)
-                rot_axis = Vector(0, 0, 1)
-                    
-            else:  # Y
-                if keep_positive:
-                    cut_box = Part.makeBox(size * 2, size, size * 2)
-                    cut_box.translate(Vector(-size, position - size, -size))
-                else:
-                    cut_box = Part.makeBox(size * 2, size, size * 2)
-                    cut_box.translate(Vector(-size, position, -size))
-                base_point = Vector(0, position, 0)
-                rot_axis = Vector(0, 0, 1)
-            
-            # Apply angle rotation
-            if angle != 0:
-                cut_box.rotate(base_point, rot_axis, angle)
-            
-            # Cut
-            result = shape.cut(cut_box)
+            if side != 0:
+                # Shape on one side of the plane, kept whole or removed
+                result = Part.Shape(shape) if (side > 0) == keep_positive else Part.makeCompound([])
+            else:
+                # Cut: remove the side that is not kept
+                result = shape.cut(half_space)
             
-            side = "+" if keep_positive else "-"
-            print(f"BisectKeep: Cut at {axis_name}={position}, keep {side} side")
+            if DEBUG:
+                side = "+" if keep_positive else "-"
+                print(f"BisectKeep: Cut at {axis_name}={position}, keep {side} side")
             return result
             
         except Exception as e:
@@ -364,6 +439,9 @@ class BisectBoth(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        # Bounding boxes of the input shapes, reused across evaluations
+        self.bbox_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Shape", True), ("Pos", True), ("Angle", True)],
                          outputs_init_list=[("Neg", True), ("Pos", True)])
@@ -377,24 +455,38 @@ class BisectBoth(FCNNodeModel):
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
         self.content.axis_edit.textChanged.connect(self.onInputChanged)
 
+    def onInputChanged(self, socket):
+        self.bbox_cache.clear()
+        super().onInputChanged(socket)
+
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.bbox_cache.next_evaluation()
+
         # Get inputs
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        position = float(sockets_input_data[1][0]) if len(sockets_input_data[1]) > 0 else 0.0
-        angle = float(sockets_input_data[2][0]) if len(sockets_input_data[2]) > 0 else 0.0
+        shape_input = flatten(sockets_input_data[0])
+        if not shape_input:
+            if DEBUG:
+                print("BisectBoth: No input shape")
+            return [[], []]
         
-        axis_text = str(self.content.axis_edit.text())
-        axis_vec, axis_name = parse_axis(axis_text)
+        position = float(sockets_input_data[1][0]) if sockets_input_data[1] else 0.0
+        angle = float(sockets_input_data[2][0]) if sockets_input_data[2] else 0.0
         
-        if len(shape_input) == 0:
-            print("BisectBoth: No input shape")
-            return [[], []]
+        axis_vec, axis_name = self.content.axis
         
         neg_results = []
         pos_results = []
         
-        for shape in shape_input:
-            neg, pos = self.make_bisect_both(shape, axis_name, position, angle)
+        # One cutting face for all shapes, sized to cover the largest one
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        bound_boxes = [self.bbox_cache.get(shape, bound_box) for shape in shapes]
+        sides = [plane_side(bbox, axis_name, position, angle) for bbox in bound_boxes]
+        size = max(cut_size(bbox) for bbox in bound_boxes)
+        base_point, normal = cutting_plane(axis_name, position, angle)
+        face = make_cut_face(base_point, normal, size) if 0 in sides else None
+        
+        for shape, side in zip(shapes, sides):
+            neg, pos = self.make_bisect_both(shape, face, side, base_point, normal, axis_name, position)
             if neg is not None:
                 neg_results.append(neg)
             if pos is not None:
@@ -402,52 +494,28 @@ class BisectBoth(FCNNodeModel):
         
         return [neg_results, pos_results]
     
-    def make_bisect_both(self, shape, axis_name, position, angle):
+    def make_bisect_both(self, shape, face, side, base_point, normal, axis_name, position):
         """Create both halves of bisect cut"""
         try:
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            bbox = shape.BoundBox
-            size = max(bbox.XLength, bbox.YLength, bbox.ZLength) * 10 + 1000
-            
-            # Create cutting boxes for both sides
-            if axis_name == "Z":
-                cut_box_pos = Part.makeBox(size * 2, size * 2, size)
-                cut_box_pos.translate(Vector(-size, -size, position))
-                cut_box_neg = Part.makeBox(size * 2, size * 2, size)
-                cut_box_neg.translate(Vector(-size, -size, position - size))
-                base_point = Vector(0, 0, position)
-                rot_axis = Vector(1, 0, 0)
-                    
-            elif axis_name == "X":
-                cut_box_pos = Part.makeBox(size, size * 2, size * 2)
-                cut_box_pos.translate(Vector(position, -size, -size))
-                cut_box_neg = Part.makeBox(size, size * 2, size * 2)
-                cut_box_neg.translate(Vector(position - size, -size, -size))
-                base_point = Vector(position, 0, 0)
-                rot_axis = Vector(0, 0, 1)
-                    
-            else:  # Y
-                cut_box_pos = Part.makeBox(size * 2, size, size * 2)
-                cut_box_pos.translate(Vector(-size, position, -size))
-                cut_box_neg = Part.makeBox(size * 2, size, size * 2)
-                cut_box_neg.translate(Vector(-size, position - size, -size))
-                base_point = Vector(0, position, 0)
-                rot_axis = Vector(0, 0, 1)
-            
-            # Apply angle rotation
-            if angle != 0:
-                cut_box_pos.rotate(base_point, rot_axis, angle)
-                cut_box_neg.rotate(base_point, rot_axis, angle)
-            
-            # Cut to get both halves
-            negative_half = shape.cut(cut_box_pos)
-            positive_half = shape.cut(cut_box_neg)
+            if side < 0:
+                # Shape below the plane
+                negative_half, positive_half = Part.Shape(shape), Part.makeCompound([])
+            elif side > 0:
+                # Shape above the plane
+                negative_half, positive_half = Part.makeCompound([]), Part.Shape(shape)
+            else:
+                try:
+                    # One split for both halves
+                    negative_half, positive_half = split_by_plane(shape, face, base_point, normal)
+                except Exception:
+                    # Cut to get both halves
+                    negative_half = shape.cut(make_half_space(face, base_point, normal, True))
+                    positive_half = shape.cut(make_half_space(face, base_point, normal, False))
             
-            print(f"BisectBoth: Split at {axis_name}={position}")
+            if DEBUG:
+                print(f"BisectBoth: Split at {axis_name}={position}")
             return (negative_half, positive_half)
             
         except Exception as e:
             print(f"BisectBoth error: {e}")
-            return (None, None)
\ No newline at end of file
+            return (None, None)
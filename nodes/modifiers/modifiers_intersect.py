@@ -16,11 +16,29 @@ import Part
 
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel
-from core.nodes_utils import map_objects, broadcast_data_tree
+from core.nodes_utils import map_objects, broadcast_data_tree, memoize_by_identity, ShapeCache
 
 from nodes_locator import icon
 
 
+def bound_box(shape):
+    return shape.BoundBox
+
+
+def common(shape_a, shape_b):
+    return shape_a.common(shape_b)
+
+
+def fills_bound_box(shape, bbox) -> bool:
+    """True for a solid that fills its bounding box, i.e. an axis aligned box"""
+    if shape.ShapeType != "Solid":
+        return False
+    box_volume = bbox.XLength * bbox.YLength * bbox.ZLength
+    box_area = 2 * (bbox.XLength * bbox.YLength + bbox.YLength * bbox.ZLength + bbox.ZLength * bbox.XLength)
+    # The bounding box is enlarged by the shape tolerance
+    return box_volume > 0 and abs(shape.Volume - box_volume) <= 1e-6 * box_area
+
+
 @register_node
 class Intersect(FCNNodeModel):
 
@@ -30,6 +48,10 @@ class Intersect(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        # Bounding boxes and intersections of the input shapes, reused across evaluations
+        self.bbox_cache: ShapeCache = ShapeCache()
+        self.common_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene,
                          inputs_init_list=[("Shape A", True), ("Shape B", True)],
                          outputs_init_list=[("Shape", True)])
@@ -38,24 +60,44 @@ class Intersect(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
 
-    @staticmethod
-    def make_intersect(parameter_zip: tuple) -> Part.Shape:
+    def onInputChanged(self, socket):
+        self.bbox_cache.clear()
+        self.common_cache.clear()
+        super().onInputChanged(socket)
+
+    def make_intersect(self, parameter_zip: tuple) -> Part.Shape:
         shape_a: Part.Shape = parameter_zip[0]
         shape_b: Part.Shape = parameter_zip[1]
 
-        return shape_a.common(shape_b)
+        bbox_a = self.bbox_cache.get(shape_a, bound_box)
+        bbox_b = self.bbox_cache.get(shape_b, bound_box)
+
+        # Disjoint bounding boxes, no common volume
+        if not bbox_a.intersect(bbox_b):
+            return Part.makeCompound([])
+
+        # One shape inside the other one, which is a box
+        if bbox_b.isInside(bbox_a) and fills_bound_box(shape_b, bbox_b):
+            return Part.Shape(shape_a)
+        if bbox_a.isInside(bbox_b) and fills_bound_box(shape_a, bbox_a):
+            return Part.Shape(shape_b)
+
+        return self.common_cache.get_pair(shape_a, shape_b, common)
 
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.bbox_cache.next_evaluation()
+        self.common_cache.next_evaluation()
+
         # Get socket inputs
-        shape_a_input: list = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
-        shape_b_input: list = sockets_input_data[1] if len(sockets_input_data[1]) > 0 else []
+        shape_a_input: list = sockets_input_data[0]
+        shape_b_input: list = sockets_input_data[1]
 
         # If either input is empty, return empty
-        if len(shape_a_input) == 0 or len(shape_b_input) == 0:
+        if not shape_a_input or not shape_b_input:
             return [[]]
 
-        # Broadcast and calculate result
+        # Broadcast and calculate result, repeated pairs are intersected once
         data_tree: list = list(broadcast_data_tree(shape_a_input, shape_b_input))
-        intersects: list = list(map_objects(data_tree, tuple, self.make_intersect))
+        intersects: list = list(map_objects(data_tree, tuple, memoize_by_identity(self.make_intersect)))
 
-        return [intersects]
\ No newline at end of file
+        return [intersects]
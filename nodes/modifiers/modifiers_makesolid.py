@@ -15,17 +15,130 @@
 #
 ###################################################################################
 
+import traceback
+
 import FreeCAD as App
 from FreeCAD import Vector
 import Part
 
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel
-from core.nodes_utils import flatten
+from core.nodes_utils import flatten, ShapeCache
 
 from nodes_locator import icon
 
 
+DEBUG = False
+
+
+def solid_as_is(shape):
+    if DEBUG:
+        print("MakeSolid: Already a solid")
+    return shape
+
+
+def solids_of_compound(shape):
+    solids = shape.Solids
+    if len(solids) == 0:
+        return None
+    if DEBUG:
+        print(f"MakeSolid: Shape has {len(solids)} solid(s)")
+    if len(solids) == 1:
+        return solids[0]
+    else:
+        return Part.makeCompound(solids)
+
+
+# Shape types that may already hold solids, other types go through the conversion methods
+SOLID_SOURCES = {
+    "Solid": solid_as_is,
+    "CompSolid": solids_of_compound,
+    "Compound": solids_of_compound,
+}
+
+
+def all_shells_closed(shape) -> bool:
+    shells = shape.Shells
+    return len(shells) > 0 and all(shell.isClosed() for shell in shells)
+
+
+def any_shell_closed(shape) -> bool:
+    return any(shell.isClosed() for shell in shape.Shells)
+
+
+def has_faces(shape) -> bool:
+    return len(shape.Faces) > 0
+
+
+def always(shape) -> bool:
+    return True
+
+
+def solid_from_shells(shape):
+    """Method 1: Direct makeSolid"""
+    solid = Part.makeSolid(shape)
+    return solid if solid.isValid() else None
+
+
+def solids_from_closed_shells(shape):
+    """Method 2: Get closed shells and convert each one"""
+    solids = []
+    for shell in shape.Shells:
+        if not shell.isClosed():
+            continue
+        try:
+            solid = Part.makeSolid(shell)
+            if solid.isValid():
+                solids.append(solid)
+        except Part.OCCError:
+            pass
+    if len(solids) == 0:
+        return None
+    elif len(solids) == 1:
+        return solids[0]
+    else:
+        return Part.makeCompound(solids)
+
+
+def solid_from_sewn_faces(shape):
+    """Method 3: Sew faces first, then make solid"""
+    # Create shell from faces
+    shell = Part.makeShell(shape.Faces)
+    
+    # Sew the shell
+    shell.sewShape()
+    
+    # Try to make solid
+    solid = Part.makeSolid(shell)
+    return solid if solid.isValid() else None
+
+
+def solid_from_bop_features(shape):
+    """Method 4: Use BOPTools"""
+    from BOPTools import BOPFeatures
+    solid = BOPFeatures.makeSolid(shape)
+    return solid if solid and solid.isValid() else None
+
+
+def solid_from_fixed_shape(shape):
+    """Method 5: Fix a copy and convert"""
+    fixed = shape.copy()
+    fixed.fix(0.01, 0.01, 0.01)  # tolerance for fixing
+    solid = Part.makeSolid(fixed)
+    return solid if solid.isValid() else None
+
+
+# Conversion methods in the order they are tried, each one only if its cheap precondition
+# holds. Methods 1 and 2 need closed shells, a solid bounded by an open shell is never valid.
+CONVERSION_PLANS = [
+    (all_shells_closed, solid_from_shells),
+    (any_shell_closed, solids_from_closed_shells),
+    (has_faces, solid_from_sewn_faces),
+    (always, solid_from_bop_features),
+    (always, solid_from_fixed_shape),
+]
+
+
 @register_node
 class MakeSolid(FCNNodeModel):
     """
@@ -51,6 +164,9 @@ class MakeSolid(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
     
     def __init__(self, scene):
+        # Converted solids of the input shapes, reused across evaluations
+        self.solid_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene,
                          inputs_init_list=[("Shape", True)],
                          outputs_init_list=[("Solid", True)])
@@ -59,22 +175,35 @@ class MakeSolid(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
     
+    def onInputChanged(self, socket):
+        self.solid_cache.clear()
+        super().onInputChanged(socket)
+    
     def eval_operation(self, sockets_input_data: list) -> list:
-        shape_input = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
+        self.solid_cache.next_evaluation()
         
-        shape_list = list(flatten(shape_input))
+        shape_list = flatten(sockets_input_data[0])
         if len(shape_list) == 0:
-            print("MakeSolid: No input shape")
+            if DEBUG:
+                print("MakeSolid: No input shape")
             return [[]]
         
         results = []
         
         for shape in shape_list:
-            solid = self.convert_to_solid(shape)
+            # Get Part.Shape from FreeCAD object
+            if hasattr(shape, 'Shape'):
+                shape = shape.Shape
+            
+            # Unchanged shapes are not converted again
+            if isinstance(shape, Part.Shape):
+                solid = self.solid_cache.get(shape, self.convert_to_solid)
+            else:
+                solid = self.convert_to_solid(shape)
             if solid is not None:
                 results.append(solid)
         
-        return [results] if results else [[]]
+        return [results]
     
     def convert_to_solid(self, shape):
         """Try multiple methods to convert shape to solid"""
@@ -83,82 +212,33 @@ class MakeSolid(FCNNodeModel):
             if hasattr(shape, 'Shape'):
                 shape = shape.Shape
             
-            # Already a solid?
-            if isinstance(shape, Part.Solid):
-                print("MakeSolid: Already a solid")
-                return shape
-            
-            if hasattr(shape, 'Solids') and len(shape.Solids) > 0:
-                print(f"MakeSolid: Shape has {len(shape.Solids)} solid(s)")
-                if len(shape.Solids) == 1:
-                    return shape.Solids[0]
-                else:
-                    return Part.makeCompound(shape.Solids)
-            
-            # Method 1: Direct makeSolid
-            try:
-                solid = Part.makeSolid(shape)
-                if solid.isValid():
-                    print("MakeSolid: Success with makeSolid()")
+            # Already a solid or containing solids?
+            solid_source = SOLID_SOURCES.get(shape.ShapeType)
+            if solid_source is not None:
+                solid = solid_source(shape)
+                if solid is not None:
                     return solid
-            except Exception as e:
-                print(f"MakeSolid: makeSolid() failed: {e}")
             
-            # Method 2: Get shell and convert
-            if hasattr(shape, 'Shells') and len(shape.Shells) > 0:
-                for shell in shape.Shells:
-                    try:
-                        solid = Part.makeSolid(shell)
-                        if solid.isValid():
-                            print("MakeSolid: Success with shell.makeSolid()")
-                            return solid
-                    except:
-                        pass
-            
-            # Method 3: Sew faces first, then make solid
-            try:
-                if hasattr(shape, 'Faces') and len(shape.Faces) > 0:
-                    # Create shell from faces
-                    shell = Part.makeShell(shape.Faces)
-                    
-                    # Sew the shell
-                    shell.sewShape()
-                    
-                    # Try to make solid
-                    solid = Part.makeSolid(shell)
-                    if solid.isValid():
-                        print("MakeSolid: Success with sewShape() + makeSolid()")
-                        return solid
-            except Exception as e:
-                print(f"MakeSolid: Sew method failed: {e}")
-            
-            # Method 4: Use BOPTools
-            try:
-                from BOPTools import BOPFeatures
-                solid = BOPFeatures.makeSolid(shape)
-                if solid and solid.isValid():
-                    print("MakeSolid: Success with BOPFeatures")
-                    return solid
-            except:
-                pass
-            
-            # Method 5: Fix and convert
-            try:
-                fixed = shape.copy()
-                fixed.fix(0.01, 0.01, 0.01)  # tolerance for fixing
-                solid = Part.makeSolid(fixed)
-                if solid.isValid():
-                    print("MakeSolid: Success with fix() + makeSolid()")
+            # Try the conversion methods whose preconditions hold until one succeeds
+            for precondition, method in CONVERSION_PLANS:
+                if not precondition(shape):
+                    continue
+                try:
+                    solid = method(shape)
+                except Exception as e:
+                    if DEBUG:
+                        print(f"MakeSolid: {method.__name__}() failed: {e}")
+                    continue
+                if solid is not None:
+                    if DEBUG:
+                        print(f"MakeSolid: Success with {method.__name__}()")
                     return solid
-            except Exception as e:
-                print(f"MakeSolid: Fix method failed: {e}")
             
             print("MakeSolid: All methods failed, returning original shape")
             return shape
             
         except Exception as e:
             print(f"MakeSolid error: {e}")
-            import traceback
             traceback.print_exc()
             return shape
 
@@ -170,7 +250,7 @@ class ShellToSolid(FCNNodeModel):
     
     Inputs:
         Shape: Shell shape
-        Tolerance: Sewing tolerance (default 0.01)
+        Tolerance: Sewing tolerance (default: 1e-4 of the bounding box diagonal)
     
     Output:
         Solid: Converted solid
@@ -184,6 +264,10 @@ class ShellToSolid(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
     
     def __init__(self, scene):
+        # Solids of the input shapes sewed with sew_tolerance, reused across evaluations
+        self.solid_cache: ShapeCache = ShapeCache()
+        self.sew_tolerance: float = None
+
         super().__init__(scene=scene,
                          inputs_init_list=[("Shape", True), ("Tolerance", True)],
                          outputs_init_list=[("Solid", True)])
@@ -192,49 +276,71 @@ class ShellToSolid(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
     
+    def onInputChanged(self, socket):
+        self.solid_cache.clear()
+        super().onInputChanged(socket)
+    
     def eval_operation(self, sockets_input_data: list) -> list:
-        shape_input = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
-        tol_input = sockets_input_data[1] if len(sockets_input_data[1]) > 0 else [0.01]
+        # No tolerance input: scaled to the size of each shape
+        tolerance = float(sockets_input_data[1][0]) if len(sockets_input_data[1]) > 0 else None
         
-        tolerance = float(tol_input[0]) if len(tol_input) > 0 else 0.01
+        # Cached solids are only valid for the tolerance they were sewed with
+        if tolerance != self.sew_tolerance:
+            self.solid_cache.clear()
+            self.sew_tolerance = tolerance
+        self.solid_cache.next_evaluation()
         
-        shape_list = list(flatten(shape_input))
+        shape_list = flatten(sockets_input_data[0])
         if len(shape_list) == 0:
             return [[]]
         
         results = []
         
         for shape in shape_list:
-            solid = self.shell_to_solid(shape, tolerance)
+            if hasattr(shape, 'Shape'):
+                shape = shape.Shape
+            
+            # Unchanged shapes are not sewed again
+            if isinstance(shape, Part.Shape):
+                solid = self.solid_cache.get(shape, lambda cached_shape: self.shell_to_solid(cached_shape, tolerance))
+            else:
+                solid = self.shell_to_solid(shape, tolerance)
             if solid is not None:
                 results.append(solid)
         
-        return [results] if results else [[]]
+        return [results]
     
     def shell_to_solid(self, shape, tolerance):
-        """Convert shell to solid with specified tolerance"""
+        """Convert shell to solid with specified tolerance, None scales it to the shape size"""
         try:
             if hasattr(shape, 'Shape'):
                 shape = shape.Shape
             
-            # Get faces
-            if hasattr(shape, 'Faces') and len(shape.Faces) > 0:
-                faces = shape.Faces
+            if isinstance(shape, Part.Shell) and shape.isClosed():
+                # Closed shell, nothing to rebuild or sew
+                shell = shape
             else:
-                print("ShellToSolid: No faces found")
-                return shape
-            
-            # Make shell from faces
-            shell = Part.makeShell(faces)
-            
-            # Sew with tolerance
-            shell.sewShape(tolerance)
+                # Get faces
+                if hasattr(shape, 'Faces') and len(shape.Faces) > 0:
+                    faces = shape.Faces
+                else:
+                    print("ShellToSolid: No faces found")
+                    return shape
+                
+                # Make shell from faces
+                shell = Part.makeShell(faces)
+                
+                # Sew with tolerance
+                if tolerance is None:
+                    tolerance = max(1e-7, shape.BoundBox.DiagonalLength * 1e-4)
+                shell.sewShape(tolerance)
             
             # Make solid
             solid = Part.makeSolid(shell)
             
             if solid.isValid():
-                print(f"ShellToSolid: Success with tolerance={tolerance}")
+                if DEBUG:
+                    print(f"ShellToSolid: Success with tolerance={tolerance}")
                 return solid
             else:
                 print("ShellToSolid: Result not valid, returning shell")
@@ -276,9 +382,8 @@ class CheckSolid(FCNNodeModel):
             socket.setSocketPosition()
     
     def eval_operation(self, sockets_input_data: list) -> list:
-        shape_input = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
         
-        shape_list = list(flatten(shape_input))
+        shape_list = flatten(sockets_input_data[0])
         if len(shape_list) == 0:
             return [[0], [0], [0]]
         
@@ -292,35 +397,38 @@ class CheckSolid(FCNNodeModel):
         num_faces = 0
         
         try:
-            if isinstance(shape, Part.Solid):
+            # Explore each sub-shape type once, only compounds can contain solids
+            shape_type = shape.ShapeType
+            num_solids = len(shape.Solids) if shape_type in ("Compound", "CompSolid") else 0
+            if shape_type == "Solid" or num_solids > 0:
                 is_solid = 1
-                print("CheckSolid: Shape IS a solid")
-            elif hasattr(shape, 'Solids') and len(shape.Solids) > 0:
-                is_solid = 1
-                print(f"CheckSolid: Shape contains {len(shape.Solids)} solid(s)")
-            else:
-                is_solid = 0
-                shape_type = type(shape).__name__
-                print(f"CheckSolid: Shape is NOT a solid, type={shape_type}")
             
             # Get volume
             if hasattr(shape, 'Volume'):
                 volume = shape.Volume
-                print(f"CheckSolid: Volume = {volume:.2f}")
             
             # Get face count
             if hasattr(shape, 'Faces'):
                 num_faces = len(shape.Faces)
-                print(f"CheckSolid: Faces = {num_faces}")
             
-            # Check if closed
-            if hasattr(shape, 'Shells'):
-                for i, shell in enumerate(shape.Shells):
-                    if hasattr(shell, 'isClosed'):
-                        closed = shell.isClosed()
-                        print(f"CheckSolid: Shell {i} isClosed = {closed}")
+            if DEBUG:
+                if shape_type == "Solid":
+                    print("CheckSolid: Shape IS a solid")
+                elif num_solids > 0:
+                    print(f"CheckSolid: Shape contains {num_solids} solid(s)")
+                else:
+                    print(f"CheckSolid: Shape is NOT a solid, type={shape_type}")
+                print(f"CheckSolid: Volume = {volume:.2f}")
+                print(f"CheckSolid: Faces = {num_faces}")
+                
+                # Check if closed
+                if hasattr(shape, 'Shells'):
+                    for i, shell in enumerate(shape.Shells):
+                        if hasattr(shell, 'isClosed'):
+                            closed = shell.isClosed()
+                            print(f"CheckSolid: Shell {i} isClosed = {closed}")
                         
         except Exception as e:
             print(f"CheckSolid error: {e}")
         
-        return [[is_solid], [volume], [num_faces]]
\ No newline at end of file
+        return [[is_solid], [volume], [num_faces]]
@@ -33,11 +33,28 @@ from nodeeditor.node_graphics_node import QDMGraphicsNode
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel, FCNNodeContentView
 from core.nodes_default_node import FCNNodeView
-from core.nodes_utils import map_objects, broadcast_data_tree, flatten
+from core.nodes_utils import map_objects, broadcast_data_tree, flatten, memoize_by_identity, ShapeCache
 
 from nodes_locator import icon
 
 
+DEBUG = False
+
+
+# Axis vectors shared by all evaluations, never modify them in place
+AXIS_X = Vector(1, 0, 0)
+AXIS_Y = Vector(0, 1, 0)
+AXIS_Z = Vector(0, 0, 1)
+ORIGIN = Vector(0, 0, 0)
+
+# Mirror plane per normalized text input, both letter orders and the normal axis alone: (normal, plane_name)
+MIRROR_PLANES = {
+    "XY": (AXIS_Z, "XY"), "YX": (AXIS_Z, "XY"), "Z": (AXIS_Z, "XY"),
+    "XZ": (AXIS_Y, "XZ"), "ZX": (AXIS_Y, "XZ"), "Y": (AXIS_Y, "XZ"),
+    "YZ": (AXIS_X, "YZ"), "ZY": (AXIS_X, "YZ"), "X": (AXIS_X, "YZ"),
+}
+
+
 def parse_mirror_plane(plane_input) -> tuple:
     """
     Parse mirror plane input.
@@ -46,7 +63,7 @@ def parse_mirror_plane(plane_input) -> tuple:
         plane_input: "XY", "XZ", "YZ", "xy", "yz", etc.
     
     Returns:
-        (normal_vector, plane_name)
+        (normal_vector, plane_name), the normal vector is shared and must not be modified
         
     Mirror planes:
         XY plane: Normal is Z (0,0,1) - mirrors across horizontal plane
@@ -54,23 +71,39 @@ def parse_mirror_plane(plane_input) -> tuple:
         YZ plane: Normal is X (1,0,0) - mirrors left/right
     """
     if isinstance(plane_input, str):
-        p = plane_input.strip().upper().replace(" ", "")
-        
-        # Sort characters to handle both "XY" and "YX"
-        chars = sorted(p)
-        plane_key = "".join(chars)
-        
-        if plane_key == "XY" or p == "Z":
-            return (Vector(0, 0, 1), "XY")
-        elif plane_key == "XZ" or p == "Y":
-            return (Vector(0, 1, 0), "XZ")
-        elif plane_key == "YZ" or p == "X":
-            return (Vector(1, 0, 0), "YZ")
-        else:
-            # Default to XY
-            return (Vector(0, 0, 1), "XY")
+        # Default to XY
+        return MIRROR_PLANES.get(plane_input.strip().upper().replace(" ", ""), MIRROR_PLANES["XY"])
+    else:
+        return MIRROR_PLANES["XY"]
+
+
+def parse_vector(vec_input, default: Vector) -> Vector:
+    """Parse point or vector input to Vector, returns default for missing or invalid input"""
+    if isinstance(vec_input, Vector):
+        return vec_input
+    elif isinstance(vec_input, (list, tuple)) and len(vec_input) >= 3:
+        return Vector(vec_input[0], vec_input[1], vec_input[2])
     else:
-        return (Vector(0, 0, 1), "XY")
+        return default
+
+
+def make_mirror(shape, normal: Vector, base_point: Vector, node_name: str):
+    """Create mirrored shape, None if OCCT fails"""
+    try:
+        # Mirror formula: P' = P - 2 * ((P - Base) · Normal) * Normal
+        return shape.mirror(base_point, normal)
+    except (Part.OCCError, RuntimeError) as e:
+        print(f"{node_name} error: {e}")
+        return None
+
+
+def make_mirror_fuse(shape, normal: Vector, base_point: Vector):
+    """Create mirrored shape and fuse with original, None if OCCT fails"""
+    try:
+        return shape.fuse(shape.mirror(base_point, normal))
+    except (Part.OCCError, RuntimeError) as e:
+        print(f"MirrorFuse error: {e}")
+        return None
 
 
 class MirrorPlaneContent(QDMNodeContentWidget):
@@ -159,58 +192,38 @@ class Mirror(FCNNodeModel):
 
     def eval_operation(self, sockets_input_data: list) -> list:
         # Get inputs
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        base_input = sockets_input_data[1][0] if len(sockets_input_data[1]) > 0 else None
+        shape_input = flatten(sockets_input_data[0])
+        base_input = sockets_input_data[1][0] if sockets_input_data[1] else None
         
         # Get plane from text box
         plane_text = str(self.content.plane_edit.text())
         normal, plane_name = parse_mirror_plane(plane_text)
         
         # Parse base point
-        base_point = self.parse_point(base_input)
+        base_point = parse_vector(base_input, ORIGIN)
         
-        if len(shape_input) == 0:
-            print("Mirror: No input shape")
+        if not shape_input:
+            if DEBUG:
+                print("Mirror: No input shape")
             return [[]]
         
+        # Unwrap document objects once before the loop
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        
+        # Repeated shapes, i.e. from broadcasting, are mirrored only once
+        mirror = memoize_by_identity(lambda shape_zip: make_mirror(shape_zip[0], normal, base_point, "Mirror"))
+        
         results = []
         
-        for shape in shape_input:
-            mirrored = self.make_mirror(shape, normal, base_point, plane_name)
+        for shape in shapes:
+            mirrored = mirror((shape,))
             if mirrored is not None:
                 results.append(mirrored)
         
+        if DEBUG:
+            print(f"Mirror: Mirrored {len(results)} shape(s) across {plane_name} plane at {base_point}")
+        
         return [results] if results else [[]]
-    
-    def parse_point(self, point_input):
-        """Parse point input to Vector"""
-        if point_input is None:
-            return Vector(0, 0, 0)
-        elif hasattr(point_input, 'x'):
-            return point_input
-        elif isinstance(point_input, (list, tuple)) and len(point_input) >= 3:
-            return Vector(point_input[0], point_input[1], point_input[2])
-        else:
-            return Vector(0, 0, 0)
-    
-    def make_mirror(self, shape, normal, base_point, plane_name):
-        """Create mirrored shape"""
-        try:
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            # Create mirror matrix
-            # Mirror formula: P' = P - 2 * ((P - Base) · Normal) * Normal
-            # Using FreeCAD's mirror method
-            
-            mirrored = shape.mirror(base_point, normal)
-            
-            print(f"Mirror: Mirrored across {plane_name} plane at {base_point}")
-            return mirrored
-            
-        except Exception as e:
-            print(f"Mirror error: {e}")
-            return None
 
 
 @register_node
@@ -252,55 +265,36 @@ class MirrorFuse(FCNNodeModel):
         self.content.plane_edit.textChanged.connect(self.onInputChanged)
 
     def eval_operation(self, sockets_input_data: list) -> list:
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        base_input = sockets_input_data[1][0] if len(sockets_input_data[1]) > 0 else None
+        shape_input = flatten(sockets_input_data[0])
+        base_input = sockets_input_data[1][0] if sockets_input_data[1] else None
         
         plane_text = str(self.content.plane_edit.text())
         normal, plane_name = parse_mirror_plane(plane_text)
         
-        base_point = self.parse_point(base_input)
+        base_point = parse_vector(base_input, ORIGIN)
         
-        if len(shape_input) == 0:
-            print("MirrorFuse: No input shape")
+        if not shape_input:
+            if DEBUG:
+                print("MirrorFuse: No input shape")
             return [[]]
         
+        # Unwrap document objects once before the loop
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        
+        # Repeated shapes, i.e. from broadcasting, are mirrored only once
+        mirror_fuse = memoize_by_identity(lambda shape_zip: make_mirror_fuse(shape_zip[0], normal, base_point))
+        
         results = []
         
-        for shape in shape_input:
-            fused = self.make_mirror_fuse(shape, normal, base_point, plane_name)
+        for shape in shapes:
+            fused = mirror_fuse((shape,))
             if fused is not None:
                 results.append(fused)
         
+        if DEBUG:
+            print(f"MirrorFuse: Mirrored and fused {len(results)} shape(s) across {plane_name} plane")
+        
         return [results] if results else [[]]
-    
-    def parse_point(self, point_input):
-        if point_input is None:
-            return Vector(0, 0, 0)
-        elif hasattr(point_input, 'x'):
-            return point_input
-        elif isinstance(point_input, (list, tuple)) and len(point_input) >= 3:
-            return Vector(point_input[0], point_input[1], point_input[2])
-        else:
-            return Vector(0, 0, 0)
-    
-    def make_mirror_fuse(self, shape, normal, base_point, plane_name):
-        """Create mirrored shape and fuse with original"""
-        try:
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            # Mirror
-            mirrored = shape.mirror(base_point, normal)
-            
-            # Fuse with original
-            fused = shape.fuse(mirrored)
-            
-            print(f"MirrorFuse: Mirrored and fused across {plane_name} plane")
-            return fused
-            
-        except Exception as e:
-            print(f"MirrorFuse error: {e}")
-            return None
 
 
 @register_node
@@ -340,56 +334,43 @@ class MirrorCustom(FCNNodeModel):
             socket.setSocketPosition()
 
     def eval_operation(self, sockets_input_data: list) -> list:
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        base_input = sockets_input_data[1][0] if len(sockets_input_data[1]) > 0 else None
-        normal_input = sockets_input_data[2][0] if len(sockets_input_data[2]) > 0 else None
+        shape_input = flatten(sockets_input_data[0])
+        base_input = sockets_input_data[1][0] if sockets_input_data[1] else None
+        normal_input = sockets_input_data[2][0] if sockets_input_data[2] else None
         
-        base_point = self.parse_vector(base_input, Vector(0, 0, 0))
-        normal = self.parse_vector(normal_input, Vector(0, 0, 1))
+        base_point = parse_vector(base_input, ORIGIN)
+        normal = parse_vector(normal_input, AXIS_Z)
         
-        # Normalize the normal vector
-        if normal.Length > 0:
-            normal = normal.normalize()
-        else:
-            normal = Vector(0, 0, 1)
+        # Normalize the normal vector into a new one, it may be the upstream input
+        length = normal.Length
+        if length == 0:
+            normal = AXIS_Z
+        elif abs(length - 1) > 1e-12:
+            normal = normal * (1 / length)
         
-        if len(shape_input) == 0:
-            print("MirrorCustom: No input shape")
+        if not shape_input:
+            if DEBUG:
+                print("MirrorCustom: No input shape")
             return [[]]
         
+        # Unwrap document objects once before the loop
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        
+        # Repeated shapes, i.e. from broadcasting, are mirrored only once
+        mirror = memoize_by_identity(
+            lambda shape_zip: make_mirror(shape_zip[0], normal, base_point, "MirrorCustom"))
+        
         results = []
         
-        for shape in shape_input:
-            mirrored = self.make_mirror(shape, normal, base_point)
+        for shape in shapes:
+            mirrored = mirror((shape,))
             if mirrored is not None:
                 results.append(mirrored)
         
+        if DEBUG:
+            print(f"MirrorCustom: Mirrored {len(results)} shape(s) across plane with normal {normal}")
+        
         return [results] if results else [[]]
-    
-    def parse_vector(self, vec_input, default):
-        if vec_input is None:
-            return default
-        elif hasattr(vec_input, 'x'):
-            return vec_input
-        elif isinstance(vec_input, (list, tuple)) and len(vec_input) >= 3:
-            return Vector(vec_input[0], vec_input[1], vec_input[2])
-        else:
-            return default
-    
-    def make_mirror(self, shape, normal, base_point):
-        """Create mirrored shape across custom plane"""
-        try:
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            mirrored = shape.mirror(base_point, normal)
-            
-            print(f"MirrorCustom: Mirrored across plane with normal {normal}")
-            return mirrored
-            
-        except Exception as e:
-            print(f"MirrorCustom error: {e}")
-            return None
 
 
 @register_node
@@ -420,6 +401,8 @@ class MirrorLine(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        self.line_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Shape", True), ("Line", True), ("Base", True)],
                          outputs_init_list=[("Shape", True)])
@@ -428,21 +411,33 @@ class MirrorLine(FCNNodeModel):
         for socket in self.inputs + self.outputs:
             socket.setSocketPosition()
 
+    def onInputChanged(self, socket):
+        self.line_cache.clear()
+        super().onInputChanged(socket)
+
     def eval_operation(self, sockets_input_data: list) -> list:
-        shape_input = list(flatten(sockets_input_data[0])) if len(sockets_input_data[0]) > 0 else []
-        line_input = sockets_input_data[1][0] if len(sockets_input_data[1]) > 0 else None
-        base_input = sockets_input_data[2][0] if len(sockets_input_data[2]) > 0 else None
+        self.line_cache.next_evaluation()
+        
+        shape_input = flatten(sockets_input_data[0])
+        line_input = sockets_input_data[1][0] if sockets_input_data[1] else None
+        base_input = sockets_input_data[2][0] if sockets_input_data[2] else None
         
-        if len(shape_input) == 0:
-            print("MirrorLine: No input shape")
+        if not shape_input:
+            if DEBUG:
+                print("MirrorLine: No input shape")
             return [[]]
         
         if line_input is None:
-            print("MirrorLine: No line input")
+            if DEBUG:
+                print("MirrorLine: No line input")
             return [[]]
         
-        # Get line direction and point
-        line_dir, line_point = self.get_line_info(line_input)
+        # Get line direction and point, cached for unchanged line shapes
+        line_input = getattr(line_input, 'Shape', line_input)
+        if isinstance(line_input, Part.Shape):
+            line_dir, line_point = self.line_cache.get(line_input, self.get_line_info)
+        else:
+            line_dir, line_point = self.get_line_info(line_input)
         
         if line_dir is None:
             print("MirrorLine: Could not get line direction")
@@ -450,38 +445,50 @@ class MirrorLine(FCNNodeModel):
         
         # Base point
         if base_input is not None:
-            base_point = self.parse_vector(base_input)
+            base_point = parse_vector(base_input, ORIGIN)
         else:
             base_point = line_point
         
         # Calculate normal: perpendicular to line direction
-        # We use cross product with Z axis (or Y if line is parallel to Z)
-        up = Vector(0, 0, 1)
-        if abs(line_dir.dot(up)) > 0.99:
-            up = Vector(0, 1, 0)
-        
-        normal = line_dir.cross(up)
-        if normal.Length > 0:
-            normal = normal.normalize()
+        # Lines along a principal axis have an axis normal, its sign does not matter for mirroring.
+        # Otherwise we use cross product with Z axis (or Y if line is parallel to Z)
+        if line_dir.y == 0 and line_dir.z == 0:
+            normal = AXIS_Y
+        elif line_dir.x == 0 and (line_dir.y == 0 or line_dir.z == 0):
+            normal = AXIS_X
         else:
-            normal = Vector(1, 0, 0)
+            up = AXIS_Z
+            if abs(line_dir.dot(up)) > 0.99:
+                up = AXIS_Y
+            
+            normal = line_dir.cross(up)
+            if normal.Length > 0:
+                normal = normal.normalize()
+            else:
+                normal = AXIS_X
+        
+        # Unwrap document objects once before the loop
+        shapes = [getattr(shape, 'Shape', shape) for shape in shape_input]
+        
+        # Repeated shapes, i.e. from broadcasting, are mirrored only once
+        mirror = memoize_by_identity(
+            lambda shape_zip: make_mirror(shape_zip[0], normal, base_point, "MirrorLine"))
         
         results = []
         
-        for shape in shape_input:
-            mirrored = self.make_mirror(shape, normal, base_point)
+        for shape in shapes:
+            mirrored = mirror((shape,))
             if mirrored is not None:
                 results.append(mirrored)
         
+        if DEBUG:
+            print(f"MirrorLine: Mirrored {len(results)} shape(s) across plane at {base_point}")
+        
         return [results] if results else [[]]
     
     def get_line_info(self, line_input):
         """Extract direction and point from line/edge input"""
         try:
-            # If it's a FreeCAD object with Shape
-            if hasattr(line_input, 'Shape'):
-                line_input = line_input.Shape
-            
             # If it's a wire, get first edge
             if hasattr(line_input, 'Edges') and len(line_input.Edges) > 0:
                 edge = line_input.Edges[0]
@@ -501,35 +508,10 @@ class MirrorLine(FCNNodeModel):
             
             # If it's a vector (direction only)
             if hasattr(line_input, 'x'):
-                return (line_input.normalize(), Vector(0, 0, 0))
+                return (Vector(line_input).normalize(), ORIGIN)
             
             return (None, None)
             
         except Exception as e:
             print(f"MirrorLine get_line_info error: {e}")
             return (None, None)
-    
-    def parse_vector(self, vec_input):
-        if vec_input is None:
-            return Vector(0, 0, 0)
-        elif hasattr(vec_input, 'x'):
-            return vec_input
-        elif isinstance(vec_input, (list, tuple)) and len(vec_input) >= 3:
-            return Vector(vec_input[0], vec_input[1], vec_input[2])
-        else:
-            return Vector(0, 0, 0)
-    
-    def make_mirror(self, shape, normal, base_point):
-        """Create mirrored shape"""
-        try:
-            if hasattr(shape, 'Shape'):
-                shape = shape.Shape
-            
-            mirrored = shape.mirror(base_point, normal)
-            
-            print(f"MirrorLine: Mirrored across plane at {base_point}")
-            return mirrored
-            
-        except Exception as e:
-            print(f"MirrorLine error: {e}")
-            return None
\ No newline at end of file
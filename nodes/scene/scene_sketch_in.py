@@ -14,7 +14,7 @@
 from collections import OrderedDict
 
 from qtpy.QtWidgets import QLineEdit, QLayout, QVBoxLayout
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QTimer
 
 import FreeCAD as App
 import Part
@@ -25,15 +25,50 @@ from nodeeditor.node_graphics_node import QDMGraphicsNode
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel, FCNNodeContentView
 from core.nodes_default_node import FCNNodeView
+from core.nodes_utils import ShapeCache
 
 from nodes_locator import icon
 
 
+DEBUG = False
+
+
+# Object names of resolved labels: {(document name, label): object name}
+RESOLVED_LABELS: dict = {}
+
+
+def find_object(doc, label: str):
+    """
+    Find a document object by label, or by name if no object has this label.
+    
+    Resolved labels are remembered, later lookups only verify the remembered object by its name instead of scanning
+    all objects of the document.
+    
+    Returns:
+        Document object or None
+    """
+    key = (doc.Name, label)
+    name = RESOLVED_LABELS.get(key)
+    if name is not None:
+        obj = doc.getObject(name)
+        if obj is not None and obj.Label == label:
+            return obj
+    
+    objs = doc.getObjectsByLabel(label)
+    if len(objs) > 0:
+        RESOLVED_LABELS[key] = objs[0].Name
+        return objs[0]
+    
+    # Try by name instead
+    return doc.getObject(label)
+
+
 class SketchInputContent(QDMNodeContentWidget):
     """Content widget with text input for sketch name"""
     
     layout: QLayout
     edit: QLineEdit
+    edit_timer: QTimer
 
     def initUI(self):
         self.layout: QLayout = QVBoxLayout()
@@ -46,6 +81,12 @@ class SketchInputContent(QDMNodeContentWidget):
 
         self.layout.addWidget(self.edit)
 
+        # Evaluate once typing pauses instead of on every keystroke
+        self.edit_timer: QTimer = QTimer(self)
+        self.edit_timer.setSingleShot(True)
+        self.edit_timer.setInterval(150)
+        self.edit.textChanged.connect(lambda: self.edit_timer.start())
+
     def serialize(self) -> OrderedDict:
         res: OrderedDict = super().serialize()
         res['value'] = self.edit.text()
@@ -90,6 +131,8 @@ class SketchIn(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        self.face_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[], 
                          outputs_init_list=[("Face", True), ("Wire", True), ("Object", True)])
@@ -101,27 +144,62 @@ class SketchIn(FCNNodeModel):
     def initInnerClasses(self):
         self.content: QDMNodeContentWidget = SketchInputContent(self)
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
-        self.content.edit.textChanged.connect(self.onInputChanged)
+        self.content.edit_timer.timeout.connect(lambda: self.onInputChanged(self.content.edit.text()))
+
+    def onInputChanged(self, socket):
+        self.face_cache.clear()
+        super().onInputChanged(socket)
+
+    def make_face_wire(self, shape) -> tuple:
+        """
+        Wire and face from the sketch shape, cached for unchanged sketches.
+        
+        Returns:
+            (face, wire), each None if it could not be created
+        """
+        # Get wire, Wires and Edges build new lists on every access
+        wire = None
+        wires = getattr(shape, 'Wires', [])
+        if len(wires) > 0:
+            wire = wires[0]
+        else:
+            edges = getattr(shape, 'Edges', [])
+            if len(edges) > 0:
+                try:
+                    wire = Part.Wire(edges)
+                except:
+                    pass
+        
+        # Make face from wire
+        face = None
+        if wire is not None:
+            try:
+                face = Part.Face(wire)
+            except Exception as e:
+                print(f"SketchIn: Could not create face - {e}")
+                print("Hint: Make sure sketch is closed (all lines connected)")
+        
+        return (face, wire)
 
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.face_cache.next_evaluation()
+        
         sketch_label: str = str(self.content.edit.text())
         
+        # Nothing typed yet
+        if not sketch_label.strip():
+            return [[], [], []]
+        
         if App.ActiveDocument is None:
             print("SketchIn: No active document")
             return [[], [], []]
         
-        # Try to find sketch by label
-        objs = App.ActiveDocument.getObjectsByLabel(sketch_label)
+        # Try to find sketch by label or name
+        sketch_obj = find_object(App.ActiveDocument, sketch_label)
         
-        if len(objs) == 0:
-            # Try by name instead
-            obj = App.ActiveDocument.getObject(sketch_label)
-            if obj is None:
-                print(f"SketchIn: Sketch '{sketch_label}' not found")
-                return [[], [], []]
-            objs = [obj]
-        
-        sketch_obj = objs[0]
+        if sketch_obj is None:
+            print(f"SketchIn: Sketch '{sketch_label}' not found")
+            return [[], [], []]
         
         # Check if it has a Shape
         if not hasattr(sketch_obj, 'Shape'):
@@ -130,25 +208,9 @@ class SketchIn(FCNNodeModel):
         
         shape = sketch_obj.Shape
         
-        # Get wire
-        wire = None
-        if hasattr(shape, 'Wires') and len(shape.Wires) > 0:
-            wire = shape.Wires[0]
-        elif hasattr(shape, 'Edges') and len(shape.Edges) > 0:
-            try:
-                wire = Part.Wire(shape.Edges)
-            except:
-                pass
-        
-        # Make face from wire
-        face = None
-        if wire is not None:
-            try:
-                face = Part.Face(wire)
-                print(f"SketchIn: Created face from '{sketch_label}'")
-            except Exception as e:
-                print(f"SketchIn: Could not create face - {e}")
-                print("Hint: Make sure sketch is closed (all lines connected)")
+        face, wire = self.face_cache.get(shape, self.make_face_wire)
+        if DEBUG and face is not None:
+            print(f"SketchIn: Created face from '{sketch_label}'")
         
         # Return outputs: Face, Wire, Object
         face_out = [face] if face is not None else []
@@ -179,6 +241,8 @@ class SketchFace(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        self.face_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[], 
                          outputs_init_list=[("Face", True)])
@@ -190,25 +254,40 @@ class SketchFace(FCNNodeModel):
     def initInnerClasses(self):
         self.content: QDMNodeContentWidget = SketchInputContent(self)
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
-        self.content.edit.textChanged.connect(self.onInputChanged)
+        self.content.edit_timer.timeout.connect(lambda: self.onInputChanged(self.content.edit.text()))
+
+    def onInputChanged(self, socket):
+        self.face_cache.clear()
+        super().onInputChanged(socket)
+
+    def make_face(self, shape):
+        """Face from the first wire of the sketch shape, cached for unchanged sketches, None if it failed"""
+        try:
+            wires = getattr(shape, 'Wires', [])
+            if len(wires) > 0:
+                return Part.Face(wires[0])
+        except Exception as e:
+            print(f"SketchFace error: {e}")
+        return None
 
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.face_cache.next_evaluation()
+        
         sketch_label: str = str(self.content.edit.text())
         
+        # Nothing typed yet
+        if not sketch_label.strip():
+            return [[]]
+        
         if App.ActiveDocument is None:
             print("SketchFace: No active document")
             return [[]]
         
         # Find sketch
-        objs = App.ActiveDocument.getObjectsByLabel(sketch_label)
-        if len(objs) == 0:
-            obj = App.ActiveDocument.getObject(sketch_label)
-            if obj is None:
-                print(f"SketchFace: '{sketch_label}' not found")
-                return [[]]
-            objs = [obj]
-        
-        sketch_obj = objs[0]
+        sketch_obj = find_object(App.ActiveDocument, sketch_label)
+        if sketch_obj is None:
+            print(f"SketchFace: '{sketch_label}' not found")
+            return [[]]
         
         if not hasattr(sketch_obj, 'Shape'):
             print(f"SketchFace: '{sketch_label}' has no Shape")
@@ -217,12 +296,10 @@ class SketchFace(FCNNodeModel):
         shape = sketch_obj.Shape
         
         # Get wire and make face
-        try:
-            if hasattr(shape, 'Wires') and len(shape.Wires) > 0:
-                face = Part.Face(shape.Wires[0])
+        face = self.face_cache.get(shape, self.make_face)
+        if face is not None:
+            if DEBUG:
                 print(f"SketchFace: Created face from '{sketch_label}'")
-                return [[face]]
-        except Exception as e:
-            print(f"SketchFace error: {e}")
+            return [[face]]
         
-        return [[]]
\ No newline at end of file
+        return [[]]
\ No newline at end of file
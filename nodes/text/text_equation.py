@@ -12,10 +12,12 @@
 #
 ###################################################################################
 from collections import OrderedDict
+from functools import lru_cache
+import ast
 import math
 
 from qtpy.QtWidgets import QLineEdit, QLayout, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QTimer
 
 from nodeeditor.node_content_widget import QDMNodeContentWidget
 from nodeeditor.node_graphics_node import QDMGraphicsNode
@@ -52,10 +54,49 @@ SAFE_MATH = {
     'degrees': math.degrees,
 }
 
+# Globals for formula evaluation without builtins, shared by all evaluations
+EVAL_GLOBALS = {"__builtins__": {}}
 
+# Safe math functions and the variables a, b, c, d, only the variables are replaced per evaluation
+VARIABLE_MATH = dict(SAFE_MATH)
+
+
+# Syntax allowed in formulas: numbers, names, arithmetic, comparisons and calls of named functions
+FORMULA_NODES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Load, ast.Tuple, ast.List,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call, ast.keyword,
+    ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+
+
+def validate_formula(tree: ast.Expression) -> None:
+    """Raise ValueError if the parsed formula uses syntax beyond FORMULA_NODES, i.e. attribute access or lambdas"""
+    for node in ast.walk(tree):
+        if not isinstance(node, FORMULA_NODES):
+            raise ValueError(f"unsupported syntax '{type(node).__name__}'")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"unsupported constant {node.value!r}")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ValueError("only named functions can be called")
+
+
+@lru_cache(maxsize=256)
+def compile_equation(formula: str):
+    """
+    Parse, validate and compile a math formula once, the code object is shared by all evaluations of the same
+    formula text.
+    
+    Like eval() on a string, leading and trailing spaces and tabs are ignored.
+    """
+    tree = ast.parse(formula.strip(" \t"), "<equation>", "eval")
+    validate_formula(tree)
+    return compile(tree, "<equation>", "eval")
+
+
+@lru_cache(maxsize=1024)
 def evaluate_equation(formula):
     """
-    Safely evaluate a math formula.
+    Safely evaluate a math formula, results are cached per formula text.
     
     Args:
         formula: String like "(100 + 50) * 2" or "sqrt(16) + pi"
@@ -63,19 +104,62 @@ def evaluate_equation(formula):
     Returns:
         Calculated result as float
     """
+    # Empty box and plain numbers need no compilation
+    if not formula.strip():
+        return 0.0
     try:
-        result = eval(formula, {"__builtins__": {}}, SAFE_MATH)
+        value = float(formula)
+        if math.isfinite(value):
+            return value
+    except ValueError:
+        pass
+    
+    try:
+        result = eval(compile_equation(formula), EVAL_GLOBALS, SAFE_MATH)
         return float(result)
     except Exception as e:
         print(f"Equation error: {e}")
         return 0.0
 
 
+def first_value(socket_input: list) -> float:
+    """First value of a socket input as float, 0.0 for an unconnected socket"""
+    return float(socket_input[0]) if socket_input else 0.0
+
+
+def uses_variables(formula) -> bool:
+    """True if the formula reads any of the variables a, b, c, d, or can not be compiled"""
+    try:
+        return not {'a', 'b', 'c', 'd'}.isdisjoint(compile_equation(formula).co_names)
+    except Exception:
+        return True
+
+
+@lru_cache(maxsize=1024)
+def evaluate_equation_vars(formula, a, b, c, d):
+    """
+    Safely evaluate a math formula using the variables a, b, c and d, results are cached per formula and values.
+    
+    Returns:
+        Calculated result as float
+    """
+    # Set variables in the persistent safe dict
+    VARIABLE_MATH.update(a=a, b=b, c=c, d=d)
+    
+    try:
+        result = eval(compile_equation(formula), EVAL_GLOBALS, VARIABLE_MATH)
+        return float(result)
+    except Exception as e:
+        print(f"EquationVar error: {e}")
+        return 0.0
+
+
 class EquationContent(QDMNodeContentWidget):
     """Content widget with equation input"""
     
     layout: QLayout
     edit: QLineEdit
+    edit_timer: QTimer
 
     def initUI(self):
         self.layout: QLayout = QVBoxLayout()
@@ -88,6 +172,12 @@ class EquationContent(QDMNodeContentWidget):
         self.edit.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.edit)
 
+        # Evaluate once typing pauses instead of on every keystroke
+        self.edit_timer: QTimer = QTimer(self)
+        self.edit_timer.setSingleShot(True)
+        self.edit_timer.setInterval(150)
+        self.edit.textChanged.connect(lambda: self.edit_timer.start())
+
     def serialize(self) -> OrderedDict:
         res: OrderedDict = super().serialize()
         res['equation'] = self.edit.text()
@@ -149,7 +239,7 @@ class Equation(FCNNodeModel):
     def initInnerClasses(self):
         self.content: QDMNodeContentWidget = EquationContent(self)
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
-        self.content.edit.textChanged.connect(self.onInputChanged)
+        self.content.edit_timer.timeout.connect(lambda: self.onInputChanged(self.content.edit.text()))
 
     def eval_operation(self, sockets_input_data: list) -> list:
         formula: str = str(self.content.edit.text())
@@ -190,25 +280,18 @@ class EquationVar(FCNNodeModel):
     def initInnerClasses(self):
         self.content: QDMNodeContentWidget = EquationContent(self)
         self.grNode: QDMGraphicsNode = FCNNodeView(self)
-        self.content.edit.textChanged.connect(self.onInputChanged)
+        self.content.edit_timer.timeout.connect(lambda: self.onInputChanged(self.content.edit.text()))
         self.content.edit.setText("a + b")  # Default formula
 
     def eval_operation(self, sockets_input_data: list) -> list:
-        # Get variable values from inputs
-        a = float(sockets_input_data[0][0]) if len(sockets_input_data[0]) > 0 else 0.0
-        b = float(sockets_input_data[1][0]) if len(sockets_input_data[1]) > 0 else 0.0
-        c = float(sockets_input_data[2][0]) if len(sockets_input_data[2]) > 0 else 0.0
-        d = float(sockets_input_data[3][0]) if len(sockets_input_data[3]) > 0 else 0.0
-        
         formula: str = str(self.content.edit.text())
         
-        # Add variables to safe dict
-        variables = {'a': a, 'b': b, 'c': c, 'd': d}
-        safe_dict = {**SAFE_MATH, **variables}
+        # Constant formulas do not depend on the inputs
+        if not uses_variables(formula):
+            return [[evaluate_equation(formula)]]
         
-        try:
-            result = eval(formula, {"__builtins__": {}}, safe_dict)
-            return [[float(result)]]
-        except Exception as e:
-            print(f"EquationVar error: {e}")
-            return [[0.0]]
\ No newline at end of file
+        # Get variable values from inputs
+        a, b, c, d = map(first_value, sockets_input_data)
+        
+        result = evaluate_equation_vars(formula, a, b, c, d)
+        return [[result]]
\ No newline at end of file
@@ -27,84 +27,105 @@ from nodeeditor.node_graphics_node import QDMGraphicsNode
 from core.nodes_conf import register_node
 from core.nodes_default_node import FCNNodeModel, FCNNodeContentView
 from core.nodes_default_node import FCNNodeView
-from core.nodes_utils import flatten
+from core.nodes_utils import ShapeCache
 
 from nodes_locator import icon
 
 
+DEBUG = False
+
+
+# Vectors and rotations shared by all evaluations, never modify them in place
+AXIS_X = Vector(1, 0, 0)
+IDENTITY = Rotation()
+HALF_TURN = Rotation(Vector(0, 0, 1), 180)
+
+
+def first_item(nested_list):
+    """First item of a nested list without flattening it, None if the list holds no items"""
+    for item in nested_list:
+        if isinstance(item, (list, tuple)):
+            item = first_item(item)
+            if item is None:
+                continue
+        return item
+    return None
+
+
+def shape_to_wire(shape):
+    """First wire of the shape, or a wire built from its edges"""
+    wires = getattr(shape, 'Wires', None)
+    if wires:
+        return wires[0]
+    
+    edges = getattr(shape, 'Edges', None)
+    if edges:
+        try:
+            return Part.Wire(edges)
+        except Part.OCCError as e:
+            print(f"get_wire_from_input error: {e}")
+    return None
+
+
 def get_wire_from_input(input_obj):
     """Extract wire from various input types including Object In output"""
-    try:
-        if input_obj is None:
-            return None
-        
-        # Handle list (Object In returns a list)
-        if isinstance(input_obj, list):
-            if len(input_obj) > 0:
-                return get_wire_from_input(input_obj[0])
-            return None
-        
-        # Already a wire
-        if isinstance(input_obj, Part.Wire):
-            return input_obj
-        
-        # Part.Shape
-        if isinstance(input_obj, Part.Shape):
-            if hasattr(input_obj, 'Wires') and len(input_obj.Wires) > 0:
-                return input_obj.Wires[0]
-            elif hasattr(input_obj, 'Edges') and len(input_obj.Edges) > 0:
-                return Part.Wire(input_obj.Edges)
-            return None
-        
-        # FreeCAD Document Object (from Object In)
-        if hasattr(input_obj, 'TypeId'):
-            if hasattr(input_obj, 'Shape'):
-                shape = input_obj.Shape
-                if hasattr(shape, 'Wires') and len(shape.Wires) > 0:
-                    return shape.Wires[0]
-                elif hasattr(shape, 'Edges') and len(shape.Edges) > 0:
-                    return Part.Wire(shape.Edges)
-            return None
-        
-        # Object with Shape attribute
-        if hasattr(input_obj, 'Shape'):
-            shape = input_obj.Shape
-            if hasattr(shape, 'Wires') and len(shape.Wires) > 0:
-                return shape.Wires[0]
-            elif hasattr(shape, 'Edges') and len(shape.Edges) > 0:
-                return Part.Wire(shape.Edges)
-        
-        return None
-        
-    except Exception as e:
-        print(f"get_wire_from_input error: {e}")
-        return None
+    # Already a wire, the common case
+    if isinstance(input_obj, Part.Wire):
+        return input_obj
+    
+    # Handle list (Object In returns a list)
+    if isinstance(input_obj, list):
+        return get_wire_from_input(input_obj[0]) if input_obj else None
+    
+    # Part.Shape
+    if isinstance(input_obj, Part.Shape):
+        return shape_to_wire(input_obj)
+    
+    # FreeCAD Document Object (from Object In) or other object with Shape attribute
+    shape = getattr(input_obj, 'Shape', None)
+    if shape is not None:
+        return shape_to_wire(shape)
+    
+    return None
+
+
+def path_layout(wire) -> tuple:
+    """
+    Edges of the wire in path order and their lengths, cached per path by the nodes.
+    
+    Returns:
+        (edges, lengths)
+    """
+    edges = wire.OrderedEdges
+    return (edges, [edge.Length for edge in edges])
 
 
-def get_points_along_wire(wire, count):
+def get_points_along_wire(wire, count, layout=None, need_tangents=True):
     """
     Get evenly distributed points along a wire.
     Uses discretize method which works reliably with Part.Wire.
+    
+    layout is the path_layout of the wire, it is computed if not given.
+    The tangents are skipped and returned as empty list if need_tangents is False.
     """
     try:
         # Use discretize to get points along the wire
         # This is the most reliable method for Part.Wire
-        wire_length = wire.Length
-        
         if count <= 1:
             # Single point at middle
             points = wire.discretize(2)
             mid_idx = len(points) // 2
-            return [points[mid_idx]], [get_tangent_at_point(wire, points[mid_idx])]
+            if not need_tangents:
+                return [points[mid_idx]], []
+            return [points[mid_idx]], [get_tangents_along_wire(wire, points, layout)[mid_idx]]
         
         # Get evenly spaced points
         points = wire.discretize(count)
+        if not need_tangents:
+            return points, []
         
         # Calculate tangents at each point
-        tangents = []
-        for i, pt in enumerate(points):
-            tangent = get_tangent_at_point(wire, pt)
-            tangents.append(tangent)
+        tangents = get_tangents_along_wire(wire, points, layout)
         
         return points, tangents
         
@@ -113,6 +134,42 @@ def get_points_along_wire(wire, count):
         return [], []
 
 
+def get_tangents_along_wire(wire, points, layout=None):
+    """
+    Get tangents at points evenly spaced by arc length along the wire, as returned by wire.discretize.
+    
+    The edges are walked once in wire order, each point is evaluated on the edge at its arc length instead of
+    searching the nearest edge. Falls back to get_tangent_at_point if an edge can not be evaluated.
+    """
+    try:
+        edges, lengths = layout if layout is not None else path_layout(wire)
+        step = sum(lengths) / (len(points) - 1) if len(points) > 1 else 0
+        
+        tangents = []
+        index = 0
+        start = 0.0
+        for i in range(len(points)):
+            distance = i * step
+            
+            # Advance to the edge containing this distance
+            while index < len(edges) - 1 and distance > start + lengths[index]:
+                start += lengths[index]
+                index += 1
+            
+            # Length from the first parameter of the edge, reversed edges are walked from their end
+            edge = edges[index]
+            local = min(max(distance - start, 0.0), lengths[index])
+            if edge.Orientation == "Reversed":
+                local = lengths[index] - local
+            
+            tangents.append(edge.tangentAt(edge.getParameterByLength(local)))
+        
+        return tangents
+        
+    except Exception:
+        return [get_tangent_at_point(wire, point) for point in points]
+
+
 def get_tangent_at_point(wire, point):
     """Get approximate tangent at a point on wire"""
     try:
@@ -174,36 +231,33 @@ def get_points_by_distance(wire, spacing):
 def calculate_rotation_to_tangent(tangent):
     """Calculate rotation to align object with tangent direction"""
     try:
-        if tangent.Length < 0.001:
-            return Rotation()
-        
-        tangent = tangent.normalize()
+        length = tangent.Length
+        if length < 0.001:
+            return IDENTITY
         
         # We want to align the X-axis (or Z-axis) to the tangent
         # Using X-axis alignment (object "points" along path)
-        x_axis = Vector(1, 0, 0)
         
-        # Cross product gives rotation axis
-        rot_axis = x_axis.cross(tangent)
+        # Cross product gives rotation axis, its length and the dot product are the scaled sine and cosine of the
+        # angle, so the tangent needs no normalization
+        rot_axis = AXIS_X.cross(tangent)
+        sin = rot_axis.Length
         
-        if rot_axis.Length < 0.001:
+        if sin < 0.001 * length:
             # Vectors are parallel or anti-parallel
             if tangent.x < 0:
-                return Rotation(Vector(0, 0, 1), 180)
+                return HALF_TURN
             else:
-                return Rotation()
+                return IDENTITY
         
-        rot_axis = rot_axis.normalize()
-        
-        # Angle between vectors
-        dot = max(-1, min(1, x_axis.dot(tangent)))
-        angle = math.degrees(math.acos(dot))
+        # Angle between vectors, Rotation normalizes the axis
+        angle = math.degrees(math.atan2(sin, AXIS_X.dot(tangent)))
         
         return Rotation(rot_axis, angle)
         
     except Exception as e:
         print(f"calculate_rotation error: {e}")
-        return Rotation()
+        return IDENTITY
 
 
 @register_node
@@ -227,6 +281,8 @@ class ArrayOnPath(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        self.path_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Shape", True), ("Path", True), 
                                           ("Count", True), ("Align", True)],
@@ -237,6 +293,8 @@ class ArrayOnPath(FCNNodeModel):
             socket.setSocketPosition()
 
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.path_cache.next_evaluation()
+        
         try:
             # Get inputs
             shape_input = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
@@ -244,9 +302,9 @@ class ArrayOnPath(FCNNodeModel):
             count_input = sockets_input_data[2] if len(sockets_input_data[2]) > 0 else [5]
             align_input = sockets_input_data[3] if len(sockets_input_data[3]) > 0 else [1]
             
-            # Flatten shape input
-            shape_list = list(flatten(shape_input))
-            if len(shape_list) == 0:
+            # First input shape
+            shape = first_item(shape_input)
+            if shape is None:
                 print("ArrayOnPath: No input shape")
                 return [[]]
             
@@ -263,42 +321,40 @@ class ArrayOnPath(FCNNodeModel):
                 return [[]]
             
             # Get shape
-            shape = shape_list[0]
             if hasattr(shape, 'Shape'):
                 shape = shape.Shape
             
-            print(f"ArrayOnPath: Wire length={wire.Length:.1f}, count={count}")
+            if DEBUG:
+                print(f"ArrayOnPath: Wire length={wire.Length:.1f}, count={count}")
             
             # Get points along wire
-            points, tangents = get_points_along_wire(wire, count)
+            layout = self.path_cache.get(wire, path_layout) if align else None
+            points, tangents = get_points_along_wire(wire, count, layout, need_tangents=align)
             
             if len(points) == 0:
                 print("ArrayOnPath: No points generated")
                 return [[]]
             
             results = []
+            placement = shape.Placement
             
             for i, point in enumerate(points):
                 try:
-                    # Copy shape
-                    copied = shape.copy()
-                    
+                    rotation = IDENTITY
                     if align and i < len(tangents):
                         # Align to tangent
-                        tangent = tangents[i]
-                        rotation = calculate_rotation_to_tangent(tangent)
-                        
-                        if rotation.Angle != 0:
-                            copied.rotate(Vector(0, 0, 0), rotation.Axis, rotation.Angle)
+                        rotation = calculate_rotation_to_tangent(tangents[i])
                     
-                    # Translate to point
-                    copied.translate(point)
+                    # Shallow copy sharing the geometry, rotated about the origin and moved to the point in one step
+                    copied = Part.Shape(shape)
+                    copied.Placement = Placement(point, rotation).multiply(placement)
                     results.append(copied)
                     
                 except Exception as e:
                     print(f"ArrayOnPath: Error at copy {i}: {e}")
             
-            print(f"ArrayOnPath: Created {len(results)} copies")
+            if DEBUG:
+                print(f"ArrayOnPath: Created {len(results)} copies")
             
             # Make compound
             if len(results) > 0:
@@ -336,6 +392,8 @@ class ArrayOnPathSpacing(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        self.path_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Shape", True), ("Path", True), 
                                           ("Spacing", True), ("Align", True)],
@@ -346,6 +404,8 @@ class ArrayOnPathSpacing(FCNNodeModel):
             socket.setSocketPosition()
 
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.path_cache.next_evaluation()
+        
         try:
             # Get inputs
             shape_input = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
@@ -353,8 +413,8 @@ class ArrayOnPathSpacing(FCNNodeModel):
             spacing_input = sockets_input_data[2] if len(sockets_input_data[2]) > 0 else [100]
             align_input = sockets_input_data[3] if len(sockets_input_data[3]) > 0 else [1]
             
-            shape_list = list(flatten(shape_input))
-            if len(shape_list) == 0:
+            shape = first_item(shape_input)
+            if shape is None:
                 print("PathSpacing: No input shape")
                 return [[], [0]]
             
@@ -369,45 +429,46 @@ class ArrayOnPathSpacing(FCNNodeModel):
                 print("PathSpacing: Could not get wire from path")
                 return [[], [0]]
             
-            shape = shape_list[0]
             if hasattr(shape, 'Shape'):
                 shape = shape.Shape
             
-            wire_length = wire.Length
+            # The edge lengths are cached with the layout, so the length is not integrated on every evaluation
+            layout = self.path_cache.get(wire, path_layout)
+            wire_length = sum(layout[1])
             
             # Calculate count based on spacing
             if spacing <= 0:
                 spacing = 100
             count = max(2, int(wire_length / spacing) + 1)
             
-            print(f"PathSpacing: Wire length={wire_length:.1f}, spacing={spacing}, count={count}")
+            if DEBUG:
+                print(f"PathSpacing: Wire length={wire_length:.1f}, spacing={spacing}, count={count}")
             
             # Get points along wire
-            points, tangents = get_points_along_wire(wire, count)
+            points, tangents = get_points_along_wire(wire, count, layout, need_tangents=align)
             
             if len(points) == 0:
                 print("PathSpacing: No points generated")
                 return [[], [0]]
             
             results = []
+            placement = shape.Placement
             
             for i, point in enumerate(points):
                 try:
-                    copied = shape.copy()
-                    
+                    rotation = IDENTITY
                     if align and i < len(tangents):
-                        tangent = tangents[i]
-                        rotation = calculate_rotation_to_tangent(tangent)
-                        if rotation.Angle != 0:
-                            copied.rotate(Vector(0, 0, 0), rotation.Axis, rotation.Angle)
+                        rotation = calculate_rotation_to_tangent(tangents[i])
                     
-                    copied.translate(point)
+                    copied = Part.Shape(shape)
+                    copied.Placement = Placement(point, rotation).multiply(placement)
                     results.append(copied)
                     
                 except Exception as e:
                     print(f"PathSpacing: Error at {i}: {e}")
             
-            print(f"PathSpacing: Created {len(results)} copies")
+            if DEBUG:
+                print(f"PathSpacing: Created {len(results)} copies")
             
             if len(results) > 0:
                 compound = Part.makeCompound(results)
@@ -442,6 +503,8 @@ class PointsOnPath(FCNNodeModel):
     content_label_objname: str = "fcn_node_bg"
 
     def __init__(self, scene):
+        self.path_cache: ShapeCache = ShapeCache()
+
         super().__init__(scene=scene, 
                          inputs_init_list=[("Path", True), ("Count", True)],
                          outputs_init_list=[("Points", True), ("Tangents", True)])
@@ -451,6 +514,8 @@ class PointsOnPath(FCNNodeModel):
             socket.setSocketPosition()
 
     def eval_operation(self, sockets_input_data: list) -> list:
+        self.path_cache.next_evaluation()
+        
         try:
             path_input = sockets_input_data[0] if len(sockets_input_data[0]) > 0 else []
             count_input = sockets_input_data[1] if len(sockets_input_data[1]) > 0 else [10]
@@ -464,12 +529,13 @@ class PointsOnPath(FCNNodeModel):
                 print("PointsOnPath: Could not get wire")
                 return [[], []]
             
-            points, tangents = get_points_along_wire(wire, count)
+            points, tangents = get_points_along_wire(wire, count, self.path_cache.get(wire, path_layout))
             
-            print(f"PointsOnPath: Generated {len(points)} points")
+            if DEBUG:
+                print(f"PointsOnPath: Generated {len(points)} points")
             
             return [points, tangents]
             
         except Exception as e:
             print(f"PointsOnPath error: {e}")
-            return [[], []]
\ No newline at end of file
+            return [[], []]
\ No newline at end of file